@@ -6,19 +6,23 @@ The deterministic engine always runs first; AI adds interpretation on top.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from typing import Any
+import re
+from operator import attrgetter
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterator, TypeVar
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
 
-from ..engine.models import DealInput, DealOutput
-from ..engine.startup_models import StartupInput, StartupValuationOutput
+from ..engine.models import DealInput, DealOutput, ScorecardMetric
+from ..engine.startup_models import ScorecardFlag, StartupInput, StartupValuationOutput
 from ..services.ai_service import (
-    ask_claude,
-    ask_claude_with_history,
+    ask_claude_async,
+    ask_claude_tool_async,
     stream_claude,
     is_ai_available,
     get_token_usage,
@@ -33,33 +37,49 @@ from ..services.ai_service import (
     MAX_TOKENS_HELP,
     MAX_TOKENS_PARSE,
     MAX_TOKENS_SCENARIO,
+    _bucket,
     _cache_key,
+    _normalize_key_part,
+    _get_cached,
+    _set_cached,
 )
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/ai")
 
+# Claude sometimes wraps JSON answers in a ```json ... ``` markdown fence
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
 
 # ---------------------------------------------------------------------------
 # Request / Response models
 # ---------------------------------------------------------------------------
 
-class ChatMessage(BaseModel):
+class _FrozenModel(BaseModel):
+    """Base for this module's request/response models: immutable once validated."""
+    model_config = ConfigDict(frozen=True)
+
+
+class ChatMessage(_FrozenModel):
     role: str   # "user" | "assistant"
     content: str
 
 
-class ChatRequest(BaseModel):
+# Dumps a message history to the SDK's [{"role", "content"}] shape inside pydantic-core
+_MESSAGES = TypeAdapter(list[ChatMessage])
+
+
+class ChatRequest(_FrozenModel):
     messages: list[ChatMessage]
     deal_input: DealInput | None = None
     deal_output: DealOutput | None = None
 
 
-class ParseDealRequest(BaseModel):
+class ParseDealRequest(_FrozenModel):
     messages: list[ChatMessage]
 
 
-class ParseDealResponse(BaseModel):
+class ParseDealResponse(_FrozenModel):
     status: str                         # "need_more_info" | "ready_to_model"
     follow_up_question: str | None
     extracted: dict[str, Any]
@@ -68,12 +88,12 @@ class ParseDealResponse(BaseModel):
     ai_available: bool
 
 
-class NarrativeRequest(BaseModel):
+class NarrativeRequest(_FrozenModel):
     deal_input: DealInput
     deal_output: DealOutput
 
 
-class NarrativeResponse(BaseModel):
+class NarrativeResponse(_FrozenModel):
     verdict_narrative: str | None
     risk_narratives: dict[str, str]
     executive_summary: str | None
@@ -81,7 +101,7 @@ class NarrativeResponse(BaseModel):
     cached: bool = False
 
 
-class FieldHelpRequest(BaseModel):
+class FieldHelpRequest(_FrozenModel):
     field_name: str
     field_label: str
     industry: str
@@ -89,13 +109,13 @@ class FieldHelpRequest(BaseModel):
     deal_context_summary: str | None = None
 
 
-class FieldHelpResponse(BaseModel):
+class FieldHelpResponse(_FrozenModel):
     explanation: str
     ai_available: bool
     cached: bool = False
 
 
-class ScenarioNarrativeRequest(BaseModel):
+class ScenarioNarrativeRequest(_FrozenModel):
     base_deal_input: DealInput
     base_deal_output: DealOutput
     scenario_row_label: str
@@ -105,12 +125,12 @@ class ScenarioNarrativeRequest(BaseModel):
     scenario_accretion_pct: float
 
 
-class StartupNarrativeRequest(BaseModel):
+class StartupNarrativeRequest(_FrozenModel):
     startup_input: StartupInput
     startup_output: StartupValuationOutput
 
 
-class StartupNarrativeResponse(BaseModel):
+class StartupNarrativeResponse(_FrozenModel):
     verdict_narrative: str | None
     scorecard_commentary: dict[str, str]
     executive_summary: str | None
@@ -118,39 +138,105 @@ class StartupNarrativeResponse(BaseModel):
     cached: bool = False
 
 
+# Shapes of the JSON objects Claude is prompted to return. Parsed in one pass
+# with model_validate_json; missing keys fall back to the defaults below.
+
+class _ParseDealPayload(_FrozenModel):
+    status: str = "need_more_info"
+    follow_up_question: str | None = None
+    extracted: dict[str, Any] = {}
+    confidence: dict[str, float] = {}
+    summary: str = ""
+
+
+class _NarrativePayload(_FrozenModel):
+    verdict_narrative: str | None = None
+    risk_narratives: dict[str, str] = {}
+    executive_summary: str | None = None
+
+
+class _StartupNarrativePayload(_FrozenModel):
+    verdict_narrative: str | None = None
+    scorecard_commentary: dict[str, str] = {}
+    executive_summary: str | None = None
+
+
+def _output_tool(name: str, description: str, payload: type[BaseModel]) -> dict[str, Any]:
+    """Anthropic tool definition whose input schema is the payload model."""
+    return {"name": name, "description": description, "input_schema": payload.model_json_schema()}
+
+
+_PARSE_DEAL_TOOL = _output_tool(
+    "return_deal_extraction", "Return the extracted deal fields and next step.", _ParseDealPayload,
+)
+_NARRATIVE_TOOL = _output_tool(
+    "return_narrative", "Return the deal assessment narrative sections.", _NarrativePayload,
+)
+_STARTUP_NARRATIVE_TOOL = _output_tool(
+    "return_startup_narrative", "Return the startup valuation narrative sections.",
+    _StartupNarrativePayload,
+)
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# List sections copied verbatim into prompt context are serialized by pydantic-core
+# in one pass over the list, instead of a per-item dict build in Python.
+_SCORECARD_CONTEXT = TypeAdapter(list[ScorecardMetric])
+_SCORECARD_CONTEXT_FIELDS = {"__all__": {"name", "formatted_value", "health_status"}}
+_FLAGS_CONTEXT = TypeAdapter(list[ScorecardFlag])
+_FLAGS_CONTEXT_FIELDS = {"__all__": {"metric", "value", "signal", "benchmark"}}
+
+
+_annual_amount = attrgetter("annual_amount")
+_NO_YEAR1 = dict.fromkeys((
+    "accretion_dilution_pct", "pro_forma_eps", "standalone_eps",
+    "net_income_m", "interest_expense_m", "ebitda_m",
+))
+
+
+def _millions(value: float, digits: int = 1) -> float:
+    return round(value / 1e6, digits)
+
+
 def _deal_context_dict(deal_input: DealInput, deal_output: DealOutput) -> dict[str, Any]:
     """Build a compact deal context dict for system prompts."""
-    y1 = deal_output.pro_forma_income_statement[0] if deal_output.pro_forma_income_statement else None
+    acquirer, target, structure = deal_input.acquirer, deal_input.target, deal_input.structure
+    synergies = deal_input.synergies
+    income = deal_output.pro_forma_income_statement
+    if income:
+        y1 = income[0]
+        year1_results = {
+            "accretion_dilution_pct": round(y1.accretion_dilution_pct, 2),
+            "pro_forma_eps": round(y1.pro_forma_eps, 2),
+            "standalone_eps": round(y1.acquirer_standalone_eps, 2),
+            "net_income_m": _millions(y1.net_income),
+            "interest_expense_m": _millions(y1.interest_expense),
+            "ebitda_m": _millions(y1.ebitda),
+        }
+    else:
+        year1_results = dict(_NO_YEAR1)
     return {
         "deal_summary": {
-            "acquirer": deal_input.acquirer.company_name,
-            "target": deal_input.target.company_name,
-            "acquisition_price_m": round(deal_input.target.acquisition_price / 1e6, 1),
-            "acquirer_revenue_m": round(deal_input.acquirer.revenue / 1e6, 1),
-            "target_revenue_m": round(deal_input.target.revenue / 1e6, 1),
-            "acquirer_ebitda_m": round(deal_input.acquirer.ebitda / 1e6, 1),
-            "target_ebitda_m": round(deal_input.target.ebitda / 1e6, 1),
-            "target_industry": deal_input.target.industry.value,
+            "acquirer": acquirer.company_name,
+            "target": target.company_name,
+            "acquisition_price_m": _millions(target.acquisition_price),
+            "acquirer_revenue_m": _millions(acquirer.revenue),
+            "target_revenue_m": _millions(target.revenue),
+            "acquirer_ebitda_m": _millions(acquirer.ebitda),
+            "target_ebitda_m": _millions(target.ebitda),
+            "target_industry": target.industry.value,
             "financing": {
-                "cash_pct": round(deal_input.structure.cash_percentage * 100, 0),
-                "stock_pct": round(deal_input.structure.stock_percentage * 100, 0),
-                "debt_pct": round(deal_input.structure.debt_percentage * 100, 0),
+                "cash_pct": round(structure.cash_percentage * 100, 0),
+                "stock_pct": round(structure.stock_percentage * 100, 0),
+                "debt_pct": round(structure.debt_percentage * 100, 0),
             },
             "entry_multiple": round(deal_output.returns_analysis.entry_multiple, 1),
             "mode": deal_input.mode.value,
         },
-        "year1_results": {
-            "accretion_dilution_pct": round(y1.accretion_dilution_pct, 2) if y1 else None,
-            "pro_forma_eps": round(y1.pro_forma_eps, 2) if y1 else None,
-            "standalone_eps": round(y1.acquirer_standalone_eps, 2) if y1 else None,
-            "net_income_m": round(y1.net_income / 1e6, 1) if y1 else None,
-            "interest_expense_m": round(y1.interest_expense / 1e6, 1) if y1 else None,
-            "ebitda_m": round(y1.ebitda / 1e6, 1) if y1 else None,
-        },
+        "year1_results": year1_results,
         "verdict": deal_output.deal_verdict.value,
         "risks": [
             {
@@ -162,21 +248,247 @@ def _deal_context_dict(deal_input: DealInput, deal_output: DealOutput) -> dict[s
             }
             for r in deal_output.risk_assessment
         ],
-        "scorecard": [
-            {"name": m.name, "value": m.formatted_value, "health": m.health_status.value}
-            for m in deal_output.deal_scorecard
-        ],
+        "scorecard": _SCORECARD_CONTEXT.dump_python(
+            deal_output.deal_scorecard, mode="json", include=_SCORECARD_CONTEXT_FIELDS,
+        ),
         "synergies": {
-            "cost_synergies_m": round(
-                sum(s.annual_amount for s in deal_input.synergies.cost_synergies) / 1e6, 2
+            "cost_synergies_m": _millions(
+                sum(map(_annual_amount, synergies.cost_synergies)), 2
             ),
-            "revenue_synergies_m": round(
-                sum(s.annual_amount for s in deal_input.synergies.revenue_synergies) / 1e6, 2
+            "revenue_synergies_m": _millions(
+                sum(map(_annual_amount, synergies.revenue_synergies)), 2
             ),
         },
     }
 
 
+def _strip_fence(response: str) -> str:
+    """Return the body of a fenced code block, or the trimmed response if unfenced."""
+    match = _FENCE_RE.match(response)
+    return match.group(1) if match else response.strip()
+
+
+class _TopLevelFieldScanner:
+    """
+    Incrementally split a streamed JSON object into its top-level fields.
+
+    Text is fed in as it arrives from the model; each top-level key is yielded
+    with its decoded value as soon as that value is complete, so the first
+    narrative section can be sent before the rest has been generated. Anything
+    before the opening brace (e.g. a ```json fence) is ignored.
+    """
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key_start = 0
+        self._key: str | None = None
+        self._value_start: int | None = None
+
+    def feed(self, chunk: str) -> Iterator[tuple[str, Any]]:
+        self._text += chunk
+        text = self._text
+        for i in range(self._pos, len(text)):
+            c = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._key is None:
+                        self._key = json.loads(text[self._key_start:i + 1])
+                continue
+            if c == '"':
+                if self._depth == 0:
+                    continue
+                self._in_string = True
+                if self._depth == 1 and self._key is None:
+                    self._key_start = i
+            elif c in "{[":
+                if self._depth or c == "{":
+                    self._depth += 1
+            elif self._depth == 0:
+                continue
+            elif c == ":" and self._depth == 1 and self._value_start is None:
+                self._value_start = i + 1
+            elif c == "," and self._depth == 1:
+                field = self._finish_field(text, i)
+                if field is not None:
+                    yield field
+            elif c in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    field = self._finish_field(text, i)
+                    if field is not None:
+                        yield field
+        self._pos = len(text)
+
+    def _finish_field(self, text: str, end: int) -> tuple[str, Any] | None:
+        key, start = self._key, self._value_start
+        self._key = self._value_start = None
+        if key is None or start is None:
+            return None
+        try:
+            return key, json.loads(text[start:end])
+        except json.JSONDecodeError:
+            return None
+
+
+# Scenario story prompt. Filled per sensitivity-cell click with format_map; the
+# fixed scaffold is identical across calls.
+_SCENARIO_PROMPT = """Describe this specific deal scenario in one paragraph.
+
+BASE CASE:
+- Acquisition price: ${base_price_m:.1f}M ({entry_mult:.1f}× EBITDA)
+- Year 1 accretion/dilution: {base_ad:+.1f}%
+- Acquirer: {acquirer}
+- Target: {target}
+
+THIS SCENARIO:
+- {row_label}: {row_value}
+- {col_label}: {col_value}
+- Resulting Year 1 accretion/dilution: {scenario_ad:+.1f}%
+
+Tell the story of what this scenario means for the deal. Would you still do it at these terms?"""
+
+_T = TypeVar("_T")
+
+# Claude calls currently in progress, by cache key. A concurrent request for the
+# same key awaits the leader's result instead of paying for a second identical call.
+_inflight: dict[str, asyncio.Future] = {}
+
+
+async def _single_flight(key: str, call: Callable[[], Awaitable[_T]]) -> _T:
+    """Run `call` at most once at a time per key; concurrent callers share its result."""
+    leader = _inflight.get(key)
+    if leader is not None:
+        try:
+            return await asyncio.shield(leader)
+        except asyncio.CancelledError:
+            if not leader.cancelled() or asyncio.current_task().cancelling():
+                raise
+            # The leader's client went away mid-call — do the work ourselves
+            return await _single_flight(key, call)
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await call()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved: there may be no followers to see it
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+
+
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+_SSE_DONE = b"data: [DONE]\n\n"
+_SSE_AI_UNAVAILABLE = b"data: [AI_UNAVAILABLE]\n\n"
+_SSE_STREAM_ERROR = b"data: [STREAM_ERROR]\n\n"
+
+
+def _sse(payload: Any) -> bytes:
+    """Encode one SSE data frame (called once per streamed token — keep it cheap)."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+_STREAM_END = object()
+
+
+async def _decoupled(chunks: AsyncIterator[str], maxsize: int = 64) -> AsyncGenerator[str, None]:
+    """
+    Re-yield `chunks`, reading them in a background task into a bounded queue.
+
+    Claude keeps streaming at its own pace even while a slow client drains the
+    SSE response, so the upstream request finishes (and frees its slot) sooner.
+    If the client disconnects, Starlette cancels the response body; closing this
+    generator then cancels the reader task and the upstream stream with it.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    async def read() -> None:
+        try:
+            async for chunk in chunks:
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_STREAM_END)
+
+    reader = asyncio.create_task(read())
+    try:
+        while (item := await queue.get()) is not _STREAM_END:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        reader.cancel()
+
+
+def _wants_event_stream(http_request: Request) -> bool:
+    return "text/event-stream" in http_request.headers.get("accept", "")
+
+
+async def _stream_json_fields(
+    system: str,
+    user_msg: str,
+    payload_model: type[BaseModel],
+    ck: str,
+    cached_raw: str | None,
+) -> AsyncGenerator[str, None]:
+    """
+    SSE body for the JSON narrative endpoints: one frame per top-level field,
+    sent as soon as Claude finishes writing it, then [DONE]. The assembled
+    payload is validated and cached exactly like the non-streaming path.
+    """
+    if cached_raw:
+        try:
+            for key, value in payload_model.model_validate_json(cached_raw).model_dump().items():
+                yield _sse({"field": key, "value": value})
+            yield _SSE_DONE
+            return
+        except ValidationError:
+            pass
+
+    scanner = _TopLevelFieldScanner()
+    parts: list[str] = []
+    try:
+        async for chunk in stream_claude(
+            system, [{"role": "user", "content": user_msg}], MAX_TOKENS_NARRATIVE
+        ):
+            parts.append(chunk)
+            for key, value in scanner.feed(chunk):
+                yield _sse({"field": key, "value": value})
+    except Exception as e:
+        logger.warning("Narrative stream error: %s", e)
+        yield _SSE_STREAM_ERROR
+    else:
+        try:
+            payload = payload_model.model_validate_json(_strip_fence("".join(parts)))
+            _set_cached(ck, payload.model_dump_json())
+        except ValidationError as e:
+            logger.warning("Failed to parse streamed narrative response: %s", e)
+
+    yield _SSE_DONE
+
+
+def _deal_context_json(deal_input: DealInput, deal_output: DealOutput) -> str:
+    """Serialize the deal context once per request for the prompt."""
+    return orjson.dumps(_deal_context_dict(deal_input, deal_output)).decode()
+
+
 def _fallback_narrative(deal_output: DealOutput) -> NarrativeResponse:
     """Return template-based narrative when AI is unavailable."""
     y1 = deal_output.pro_forma_income_statement[0] if deal_output.pro_forma_income_statement else None
@@ -223,16 +535,17 @@ async def parse_deal(request: ParseDealRequest) -> ParseDealResponse:
             ai_available=False,
         )
 
-    messages = [{"role": m.role, "content": m.content} for m in request.messages]
+    messages = _MESSAGES.dump_python(request.messages)
     system = deal_parser_system_prompt()
 
-    response = ask_claude_with_history(
+    extracted = await ask_claude_tool_async(
         system_prompt=system,
         messages=messages,
+        tool=_PARSE_DEAL_TOOL,
         max_tokens=MAX_TOKENS_PARSE,
     )
 
-    if not response:
+    if extracted is None:
         return ParseDealResponse(
             status="ai_unavailable",
             follow_up_question=None,
@@ -243,35 +556,22 @@ async def parse_deal(request: ParseDealRequest) -> ParseDealResponse:
         )
 
     try:
-        # Strip markdown code blocks if present
-        clean = response.strip()
-        if clean.startswith("```"):
-            clean = clean.split("```")[1]
-            if clean.startswith("json"):
-                clean = clean[4:]
-        parsed = json.loads(clean)
-        return ParseDealResponse(
-            status=parsed.get("status", "need_more_info"),
-            follow_up_question=parsed.get("follow_up_question"),
-            extracted=parsed.get("extracted", {}),
-            confidence=parsed.get("confidence", {}),
-            summary=parsed.get("summary", ""),
-            ai_available=True,
-        )
-    except (json.JSONDecodeError, KeyError) as e:
-        logger.warning("Failed to parse Claude deal extraction response: %s\nRaw: %s", e, response)
+        parsed = _ParseDealPayload.model_validate(extracted)
+        return ParseDealResponse(**parsed.model_dump(), ai_available=True)
+    except ValidationError as e:
+        logger.warning("Invalid deal extraction from Claude: %s\nRaw: %s", e, extracted)
         return ParseDealResponse(
             status="need_more_info",
             follow_up_question="Could you tell me more about the companies involved and the deal size?",
             extracted={},
             confidence={},
-            summary=response[:300],
+            summary=str(extracted.get("summary", ""))[:300],
             ai_available=True,
         )
 
 
 @router.post("/generate-narrative", response_model=NarrativeResponse, summary="Generate AI deal narrative")
-async def generate_narrative(request: NarrativeRequest) -> NarrativeResponse:
+async def generate_narrative(request: NarrativeRequest, http_request: Request):
     """
     Generate three narrative sections using Claude:
     - Verdict narrative (punchy banker assessment)
@@ -279,90 +579,96 @@ async def generate_narrative(request: NarrativeRequest) -> NarrativeResponse:
     - Executive summary (board-ready)
 
     Batches all three into one API call. Results are cached by deal fingerprint.
+    With `Accept: text/event-stream`, each section is streamed as an SSE frame
+    ({"field": ..., "value": ...}) as soon as it is complete.
     """
     if not is_ai_available():
         return _fallback_narrative(request.deal_output)
 
-    # Cache key: hash of key deal parameters
+    # Cache key: key deal parameters in 1% bands, plus whether Year 1 is accretive
+    income = request.deal_output.pro_forma_income_statement
+    accretive = bool(income) and income[0].accretion_dilution_pct > 0
     deal_fingerprint = _cache_key(
-        str(round(request.deal_input.target.acquisition_price, -3)),
-        str(round(request.deal_input.acquirer.ebitda, -3)),
-        str(round(request.deal_input.target.ebitda, -3)),
+        _bucket(request.deal_input.target.acquisition_price),
+        _bucket(request.deal_input.acquirer.ebitda),
+        _bucket(request.deal_input.target.ebitda),
+        "accretive" if accretive else "dilutive",
         str(len(request.deal_output.risk_assessment)),
         request.deal_input.mode.value,
     )
     ck = f"narrative:{deal_fingerprint}"
 
     system = narrative_system_prompt(request.deal_input.mode.value)
-    context = _deal_context_dict(request.deal_input, request.deal_output)
+    context_json = _deal_context_json(request.deal_input, request.deal_output)
 
     user_msg = f"""Generate a deal assessment for this transaction:
 
-{json.dumps(context, indent=2)}
+{context_json}
 
 Verdict headline from engine: {request.deal_output.deal_verdict_headline}
 Risks identified: {[r.metric_name for r in request.deal_output.risk_assessment]}
 
 Generate the verdict_narrative, risk_narratives (one per identified risk by metric_name), and executive_summary."""
 
-    from ..services.ai_service import _get_cached, _set_cached
     cached_raw = _get_cached(ck)
+    if _wants_event_stream(http_request):
+        return StreamingResponse(
+            _stream_json_fields(system, user_msg, _NarrativePayload, ck, cached_raw),
+            media_type="text/event-stream",
+            headers=_SSE_HEADERS,
+        )
+
     if cached_raw:
         try:
-            data = json.loads(cached_raw)
-            return NarrativeResponse(
-                verdict_narrative=data.get("verdict_narrative"),
-                risk_narratives=data.get("risk_narratives", {}),
-                executive_summary=data.get("executive_summary"),
-                ai_available=True,
-                cached=True,
-            )
-        except Exception:
+            data = _NarrativePayload.model_validate_json(cached_raw)
+            return NarrativeResponse(**data.model_dump(), ai_available=True, cached=True)
+        except ValidationError:
             pass
 
-    response = ask_claude(
+    sections = await _single_flight(ck, lambda: ask_claude_tool_async(
         system_prompt=system,
-        user_message=user_msg,
+        messages=[{"role": "user", "content": user_msg}],
+        tool=_NARRATIVE_TOOL,
         max_tokens=MAX_TOKENS_NARRATIVE,
-        cache_key=None,  # We handle caching ourselves here
-    )
+    ))
 
-    if not response:
+    if sections is None:
         return _fallback_narrative(request.deal_output)
 
     try:
-        clean = response.strip()
-        if clean.startswith("```"):
-            clean = clean.split("```")[1]
-            if clean.startswith("json"):
-                clean = clean[4:]
-        data = json.loads(clean)
-        _set_cached(ck, json.dumps(data))
+        data = _NarrativePayload.model_validate(sections)
+        _set_cached(ck, data.model_dump_json())
+        return NarrativeResponse(**data.model_dump(), ai_available=True, cached=False)
+    except ValidationError as e:
+        logger.warning("Invalid narrative sections from Claude: %s", e)
         return NarrativeResponse(
-            verdict_narrative=data.get("verdict_narrative"),
-            risk_narratives=data.get("risk_narratives", {}),
-            executive_summary=data.get("executive_summary"),
-            ai_available=True,
-            cached=False,
-        )
-    except (json.JSONDecodeError, KeyError) as e:
-        logger.warning("Failed to parse narrative response: %s", e)
-        # Try to extract verdict narrative from raw text as fallback
-        return NarrativeResponse(
-            verdict_narrative=response[:600] if response else None,
+            verdict_narrative=None,
             risk_narratives={r.metric_name: r.plain_english for r in request.deal_output.risk_assessment},
             executive_summary=None,
             ai_available=True,
         )
 
 
+def _field_help_cache_key(request: FieldHelpRequest) -> str:
+    """
+    Cache key for a field explanation. Field and industry names are normalized;
+    the current value only loses surrounding whitespace and case, since the
+    explanation quotes it back and its sign and separators matter.
+    """
+    return _cache_key(
+        _normalize_key_part(request.field_name),
+        _normalize_key_part(request.industry),
+        (request.current_value or "").strip().casefold(),
+    )
+
+
 @router.post("/explain-field", response_model=FieldHelpResponse, summary="Get contextual field help")
 async def explain_field(request: FieldHelpRequest) -> FieldHelpResponse:
     """
     Return a contextual AI explanation of a specific input field.
     Cached per field+industry combination.
     """
-    ck = _cache_key(request.field_name, request.industry, request.current_value or "")
+    ck = _field_help_cache_key(request)
 
     if not is_ai_available():
         return FieldHelpResponse(
@@ -370,7 +676,6 @@ async def explain_field(request: FieldHelpRequest) -> FieldHelpResponse:
             ai_available=False,
         )
 
-    from ..services.ai_service import _get_cached
     cached = _get_cached(ck)
     if cached:
         return FieldHelpResponse(explanation=cached, ai_available=True, cached=True)
@@ -388,12 +693,12 @@ async def explain_field(request: FieldHelpRequest) -> FieldHelpResponse:
         "and what range to expect."
     )
 
-    response = ask_claude(
+    response = await _single_flight(ck, lambda: ask_claude_async(
         system_prompt=system,
         user_message=user_msg,
         max_tokens=MAX_TOKENS_HELP,
         cache_key=ck,
-    )
+    ))
 
     return FieldHelpResponse(
         explanation=response or "",
@@ -410,38 +715,33 @@ async def chat(request: ChatRequest) -> StreamingResponse:
     Keeps up to 20 messages of history. Has full deal context in system prompt.
     Returns Server-Sent Events (text/event-stream).
     """
+    context_json = "{}"
+    if request.deal_input and request.deal_output:
+        context_json = _deal_context_json(request.deal_input, request.deal_output)
+
     async def generate():
         if not is_ai_available():
-            yield "data: [AI_UNAVAILABLE]\n\n"
+            yield _SSE_AI_UNAVAILABLE
             return
 
-        context = {}
-        if request.deal_input and request.deal_output:
-            context = _deal_context_dict(request.deal_input, request.deal_output)
-
-        system = chat_system_prompt(context)
+        system = chat_system_prompt(context_json)
 
         # Trim to last 20 messages to stay within context
-        recent = request.messages[-20:]
-        messages = [{"role": m.role, "content": m.content} for m in recent]
+        messages = _MESSAGES.dump_python(request.messages[-20:])
 
         try:
-            async for chunk in stream_claude(system, messages, MAX_TOKENS_CHAT):
-                # SSE format: data: <chunk>\n\n
-                yield f"data: {json.dumps(chunk)}\n\n"
+            async for chunk in _decoupled(stream_claude(system, messages, MAX_TOKENS_CHAT)):
+                yield _sse(chunk)
         except Exception as e:
             logger.warning("Chat stream error: %s", e)
-            yield "data: [STREAM_ERROR]\n\n"
+            yield _SSE_STREAM_ERROR
 
-        yield "data: [DONE]\n\n"
+        yield _SSE_DONE
 
     return StreamingResponse(
         generate(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-        },
+        headers=_SSE_HEADERS,
     )
 
 
@@ -450,59 +750,56 @@ async def scenario_narrative(request: ScenarioNarrativeRequest) -> StreamingResp
     """
     Stream a one-paragraph scenario narrative when a user clicks a sensitivity cell.
     """
+    base_input = request.base_deal_input
+    base_output = request.base_deal_output
+    y1_base = base_output.pro_forma_income_statement[0] if base_output.pro_forma_income_statement else None
+    user_msg = _SCENARIO_PROMPT.format_map({
+        "base_price_m": base_input.target.acquisition_price / 1e6,
+        "entry_mult": base_output.returns_analysis.entry_multiple,
+        "base_ad": y1_base.accretion_dilution_pct if y1_base else 0,
+        "acquirer": base_input.acquirer.company_name,
+        "target": base_input.target.company_name,
+        "row_label": request.scenario_row_label,
+        "row_value": request.scenario_row_value,
+        "col_label": request.scenario_col_label,
+        "col_value": request.scenario_col_value,
+        "scenario_ad": request.scenario_accretion_pct,
+    })
+
     async def generate():
         if not is_ai_available():
-            yield "data: [AI_UNAVAILABLE]\n\n"
+            yield _SSE_AI_UNAVAILABLE
             return
 
-        y1_base = request.base_deal_output.pro_forma_income_statement[0] if request.base_deal_output.pro_forma_income_statement else None
-        base_ad = y1_base.accretion_dilution_pct if y1_base else 0
-        base_price = request.base_deal_input.target.acquisition_price
-        entry_mult = request.base_deal_output.returns_analysis.entry_multiple
-
-        user_msg = f"""Describe this specific deal scenario in one paragraph.
-
-BASE CASE:
-- Acquisition price: ${base_price/1e6:.1f}M ({entry_mult:.1f}× EBITDA)
-- Year 1 accretion/dilution: {base_ad:+.1f}%
-- Acquirer: {request.base_deal_input.acquirer.company_name}
-- Target: {request.base_deal_input.target.company_name}
-
-THIS SCENARIO:
-- {request.scenario_row_label}: {request.scenario_row_value}
-- {request.scenario_col_label}: {request.scenario_col_value}
-- Resulting Year 1 accretion/dilution: {request.scenario_accretion_pct:+.1f}%
-
-Tell the story of what this scenario means for the deal. Would you still do it at these terms?"""
-
         try:
-            async for chunk in stream_claude(
+            async for chunk in _decoupled(stream_claude(
                 scenario_system_prompt(),
                 [{"role": "user", "content": user_msg}],
                 MAX_TOKENS_SCENARIO,
-            ):
-                yield f"data: {json.dumps(chunk)}\n\n"
+            )):
+                yield _sse(chunk)
         except Exception as e:
             logger.warning("Scenario narrative stream error: %s", e)
 
-        yield "data: [DONE]\n\n"
+        yield _SSE_DONE
 
     return StreamingResponse(
         generate(),
         media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        headers=_SSE_HEADERS,
     )
 
 
 @router.post("/startup-narrative", response_model=StartupNarrativeResponse, summary="Generate AI startup valuation narrative")
-async def startup_narrative(request: StartupNarrativeRequest) -> StartupNarrativeResponse:
+async def startup_narrative(request: StartupNarrativeRequest, http_request: Request):
     """
     Generate three narrative sections for a startup valuation using Claude:
     - Verdict narrative (VC advisor's take on the valuation)
     - Per-scorecard-flag commentary
     - Executive summary (IC-ready)
 
-    Results are cached by startup fingerprint.
+    Results are cached by startup fingerprint. Supports the same
+    `Accept: text/event-stream` per-section streaming as /generate-narrative.
     """
     if not is_ai_available():
         return StartupNarrativeResponse(
@@ -518,25 +815,19 @@ async def startup_narrative(request: StartupNarrativeRequest) -> StartupNarrativ
     fingerprint = _cache_key(
         inp.fundraise.vertical,
         inp.fundraise.stage,
-        str(round(out.blended_valuation, 1)),
-        str(round(out.benchmark_p50, 1)),
+        _bucket(out.blended_valuation, 0.05),
+        _bucket(out.benchmark_p50, 0.05),
         out.verdict,
     )
     ck = f"startup_narrative:{fingerprint}"
 
-    from ..services.ai_service import _get_cached, _set_cached
     cached_raw = _get_cached(ck)
-    if cached_raw:
+    stream = _wants_event_stream(http_request)
+    if cached_raw and not stream:
         try:
-            data = json.loads(cached_raw)
-            return StartupNarrativeResponse(
-                verdict_narrative=data.get("verdict_narrative"),
-                scorecard_commentary=data.get("scorecard_commentary", {}),
-                executive_summary=data.get("executive_summary"),
-                ai_available=True,
-                cached=True,
-            )
-        except Exception:
+            data = _StartupNarrativePayload.model_validate_json(cached_raw)
+            return StartupNarrativeResponse(**data.model_dump(), ai_available=True, cached=True)
+        except ValidationError:
             pass
 
     # Build compact context for the prompt
@@ -567,33 +858,34 @@ async def startup_narrative(request: StartupNarrativeRequest) -> StartupNarrativ
             }
             for m in out.method_results
         ],
-        "scorecard_flags": [
-            {
-                "metric": f.metric,
-                "value": f.value,
-                "signal": f.signal,
-                "benchmark": f.benchmark,
-            }
-            for f in out.investor_scorecard
-        ],
+        "scorecard_flags": _FLAGS_CONTEXT.dump_python(
+            out.investor_scorecard, mode="json", include=_FLAGS_CONTEXT_FIELDS,
+        ),
         "warnings": out.warnings,
     }
 
     user_msg = f"""Generate a startup valuation assessment for this company:
 
-{json.dumps(context, indent=2)}
+{orjson.dumps(context).decode()}
 
 Generate the verdict_narrative, scorecard_commentary (one entry per scorecard flag metric), and executive_summary."""
 
     system = startup_narrative_system_prompt()
-    response = ask_claude(
+    if stream:
+        return StreamingResponse(
+            _stream_json_fields(system, user_msg, _StartupNarrativePayload, ck, cached_raw),
+            media_type="text/event-stream",
+            headers=_SSE_HEADERS,
+        )
+
+    sections = await _single_flight(ck, lambda: ask_claude_tool_async(
         system_prompt=system,
-        user_message=user_msg,
+        messages=[{"role": "user", "content": user_msg}],
+        tool=_STARTUP_NARRATIVE_TOOL,
         max_tokens=MAX_TOKENS_NARRATIVE,
-        cache_key=None,
-    )
+    ))
 
-    if not response:
+    if sections is None:
         return StartupNarrativeResponse(
             verdict_narrative=None,
             scorecard_commentary={},
@@ -602,24 +894,13 @@ Generate the verdict_narrative, scorecard_commentary (one entry per scorecard fl
         )
 
     try:
-        clean = response.strip()
-        if clean.startswith("```"):
-            clean = clean.split("```")[1]
-            if clean.startswith("json"):
-                clean = clean[4:]
-        data = json.loads(clean)
-        _set_cached(ck, json.dumps(data))
+        data = _StartupNarrativePayload.model_validate(sections)
+        _set_cached(ck, data.model_dump_json())
+        return StartupNarrativeResponse(**data.model_dump(), ai_available=True, cached=False)
+    except ValidationError as e:
+        logger.warning("Invalid startup narrative sections from Claude: %s", e)
         return StartupNarrativeResponse(
-            verdict_narrative=data.get("verdict_narrative"),
-            scorecard_commentary=data.get("scorecard_commentary", {}),
-            executive_summary=data.get("executive_summary"),
-            ai_available=True,
-            cached=False,
-        )
-    except (json.JSONDecodeError, KeyError) as e:
-        logger.warning("Failed to parse startup narrative response: %s", e)
-        return StartupNarrativeResponse(
-            verdict_narrative=response[:600] if response else None,
+            verdict_narrative=None,
             scorecard_commentary={},
             executive_summary=None,
             ai_available=True,
@@ -0,0 +1,50 @@
+"""
+Shared response classes and helpers for the API routers.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Any, NamedTuple
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson instead of the stdlib encoder.
+
+    Engine outputs are deep trees of floats; orjson encodes them several times
+    faster. Non-finite floats render as null rather than raising.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+# ---------------------------------------------------------------------------
+# Pre-serialized reference data
+# ---------------------------------------------------------------------------
+
+class TaggedBody(NamedTuple):
+    """A serialized JSON body and its strong ETag."""
+    body: bytes
+    etag: str
+
+
+def tagged_json(content: Any) -> TaggedBody:
+    """Serialize `content` once and derive its ETag from the bytes."""
+    body = orjson.dumps(content)
+    return TaggedBody(body, f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"')
+
+
+def conditional_response(http_request: Request, tagged: TaggedBody) -> Response:
+    """Return the cached body, or 304 Not Modified if the client already holds it."""
+    headers = {"ETag": tagged.etag}
+    if_none_match = http_request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if tagged.etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(tagged.body, media_type="application/json", headers=headers)
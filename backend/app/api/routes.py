@@ -3,11 +3,18 @@ FastAPI route definitions for the dealflow engine API.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import ValidationError
 
 from ..engine import run_deal, round_financial_output
@@ -18,9 +25,99 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1")
 
+# ---------------------------------------------------------------------------
+# Deal analysis worker pool
+# ---------------------------------------------------------------------------
+
+# run_deal is CPU-bound pure Python. Running it on the event loop stalls every
+# other endpoint (including AI streaming) for the length of the analysis, so it
+# runs in a process pool instead. ENGINE_WORKERS=0 uses the loop's default
+# thread pool — handy for development and debugging.
+ENGINE_WORKERS = int(os.environ.get("ENGINE_WORKERS", str(os.cpu_count() or 1)))
+
+_deal_pool: ProcessPoolExecutor | None = None
+
+
+def _get_deal_pool() -> ProcessPoolExecutor | None:
+    """Lazily create the deal-analysis process pool (None → thread pool)."""
+    global _deal_pool
+    if _deal_pool is None and ENGINE_WORKERS > 0:
+        # spawn, not fork: the parent runs an event loop and helper threads
+        _deal_pool = ProcessPoolExecutor(
+            max_workers=ENGINE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _deal_pool
+
+
+def prestart_deal_pool() -> None:
+    """
+    Spawn every worker up front (called from the app lifespan on startup).
+
+    Workers are otherwise spawned on demand, so the first requests would each
+    pay for a fresh interpreter importing the engine and its models.
+    """
+    pool = _get_deal_pool()
+    if pool is None:
+        return
+    # Back-to-back submits find no idle worker, so each one spawns a process
+    for future in [pool.submit(os.getpid) for _ in range(ENGINE_WORKERS)]:
+        future.result()
+
+
+def shutdown_deal_pool() -> None:
+    """Stop the worker pool (called from the app lifespan on shutdown)."""
+    global _deal_pool
+    if _deal_pool is not None:
+        _deal_pool.shutdown(cancel_futures=True)
+        _deal_pool = None
+
+
+# ---------------------------------------------------------------------------
+# Analysis result cache
+# ---------------------------------------------------------------------------
+
+# The frontend re-submits unchanged deals (navigating back to results, toggling
+# views), and each analysis is a full run_deal. Responses are immutable bytes,
+# so they are cached on the event loop keyed by the deal's JSON dump — a hit
+# skips both the engine and the trip to the worker pool. Year 1 is the current
+# calendar year, so the year is part of the key.
+_ANALYSIS_CACHE_MAX_ENTRIES = 256
+
+# Insertion-ordered dict used as an LRU: hits move to the end, evictions pop the front
+_analysis_cache: OrderedDict[tuple[int, str], bytes] = OrderedDict()
+
+
+def _analysis_cache_key(deal: DealInput) -> tuple[int, str]:
+    return date.today().year, deal.model_dump_json()
+
+
+def _get_cached_analysis(key: tuple[int, str]) -> bytes | None:
+    body = _analysis_cache.get(key)
+    if body is not None:
+        _analysis_cache.move_to_end(key)
+    return body
+
+
+def _set_cached_analysis(key: tuple[int, str], body: bytes) -> None:
+    _analysis_cache[key] = body
+    _analysis_cache.move_to_end(key)
+    if len(_analysis_cache) > _ANALYSIS_CACHE_MAX_ENTRIES:
+        _analysis_cache.popitem(last=False)
+
+
+def _analyze(deal: DealInput) -> bytes:
+    """
+    Run the model and serialize it for the wire. Executes inside a worker.
+
+    Serializing here means the pool ships one bytes object back instead of
+    pickling the whole output tree, and the response is encoded exactly once.
+    """
+    return orjson.dumps(round_financial_output(run_deal(deal)))
+
 
 @router.post("/analyze", response_model=DealOutput, summary="Run deal analysis")
-async def analyze_deal(deal: DealInput) -> DealOutput:
+async def analyze_deal(deal: DealInput) -> Response:
     """
     Execute the full M&A deal model and return structured results.
 
@@ -33,36 +130,53 @@ async def analyze_deal(deal: DealInput) -> DealOutput:
     - Deal verdict and scorecard
     """
     try:
-        logger.info(
-            "Analyzing deal: %s acquiring %s for $%,.0f",
-            deal.acquirer.company_name,
-            deal.target.company_name,
-            deal.target.acquisition_price,
-        )
-        result = run_deal(deal)
-        return JSONResponse(content=round_financial_output(result))
-    except ValidationError as e:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Analyzing deal: %s acquiring %s for $%.0f",
+                deal.acquirer.company_name,
+                deal.target.company_name,
+                deal.target.acquisition_price,
+            )
+        cache_key = _analysis_cache_key(deal)
+        body = _get_cached_analysis(cache_key)
+        if body is None:
+            loop = asyncio.get_running_loop()
+            body = await loop.run_in_executor(_get_deal_pool(), _analyze, deal)
+            _set_cached_analysis(cache_key, body)
+        return Response(body, media_type="application/json")
+    except ValidationError:
         raise HTTPException(status_code=422, detail="Invalid deal inputs. Please check your values and try again.")
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); drop the pool so the next request gets a fresh one
+        logger.exception("Deal analysis worker pool broke")
+        shutdown_deal_pool()
+        raise HTTPException(status_code=500, detail="Deal analysis encountered an internal error. Please try again.")
     except Exception:
         logger.exception("Deal analysis failed")
         raise HTTPException(status_code=500, detail="Deal analysis encountered an internal error. Please try again.")
 
 
-@router.get("/defaults", summary="Get smart defaults for a deal")
-async def get_smart_defaults(
-    industry: Industry,
-    deal_size: float,
-    target_revenue: float,
-) -> dict[str, Any]:
-    """
-    Return recommended default assumptions for a given industry and deal size.
+# ---------------------------------------------------------------------------
+# Reference data
+# ---------------------------------------------------------------------------
 
-    Use this to pre-fill form fields with intelligent estimates before the user
-    provides custom inputs.
-    """
-    try:
+# These responses only change with a deploy, so they are serialized once at import
+_INDUSTRIES_BYTES = orjson.dumps([{"value": ind.value, "label": ind.value} for ind in Industry])
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "service": "dealflow-engine"})
+
+# get_defaults depends on deal_size only through the fee tier and the
+# middle-market/large-cap rate tier (target_revenue is unused), so the serialized
+# body is cached per band. The key space is small and fixed.
+_defaults_cache: dict[tuple[Industry, float, float], bytes] = {}
+
+
+def _defaults_body(industry: Industry, deal_size: float, target_revenue: float) -> bytes:
+    """Serialized /defaults payload, cached per industry and deal-size band."""
+    key = (industry, get_transaction_fee_pct(deal_size), get_interest_rate(deal_size))
+    body = _defaults_cache.get(key)
+    if body is None:
         defaults = get_defaults(industry, deal_size, target_revenue)
-        return {
+        body = orjson.dumps({
             "tax_rate": defaults.tax_rate,
             "transaction_fees_pct": defaults.transaction_fees_pct,
             "blended_interest_rate": defaults.blended_interest_rate,
@@ -88,19 +202,37 @@ async def get_smart_defaults(
                 "procurement_synergy_pct_cogs": defaults.procurement_synergy_pct_cogs,
                 "facility_synergy_pct_revenue": defaults.facility_synergy_pct_revenue,
             },
-        }
+        })
+        _defaults_cache[key] = body
+    return body
+
+
+@router.get("/defaults", response_model=dict[str, Any], summary="Get smart defaults for a deal")
+async def get_smart_defaults(
+    industry: Industry,
+    deal_size: float,
+    target_revenue: float,
+) -> Response:
+    """
+    Return recommended default assumptions for a given industry and deal size.
+
+    Use this to pre-fill form fields with intelligent estimates before the user
+    provides custom inputs.
+    """
+    try:
+        return Response(_defaults_body(industry, deal_size, target_revenue), media_type="application/json")
     except Exception:
         logger.exception("Failed to retrieve defaults for industry=%s deal_size=%s", industry, deal_size)
         raise HTTPException(status_code=500, detail="Failed to retrieve industry defaults.")
 
 
-@router.get("/industries", summary="List supported industries")
-async def list_industries() -> list[dict[str, str]]:
+@router.get("/industries", response_model=list[dict[str, str]], summary="List supported industries")
+async def list_industries() -> Response:
     """Return all supported industry verticals."""
-    return [{"value": ind.value, "label": ind.value} for ind in Industry]
+    return Response(_INDUSTRIES_BYTES, media_type="application/json")
 
 
-@router.get("/health", summary="Health check")
-async def health_check() -> dict[str, str]:
+@router.get("/health", response_model=dict[str, str], summary="Health check")
+async def health_check() -> Response:
     """Simple health check endpoint."""
-    return {"status": "healthy", "service": "dealflow-engine"}
+    return Response(_HEALTH_BYTES, media_type="application/json")
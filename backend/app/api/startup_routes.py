@@ -4,23 +4,32 @@ Prefix: /api/startup
 """
 from __future__ import annotations
 
-import json
+import functools
 import logging
-import os
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import ValidationError
 
 from ..engine import round_financial_output
 from ..engine.startup_models import StartupInput, StartupValuationOutput, StartupVertical, StartupStage
-from ..engine.startup_engine import run_startup_valuation
+from ..engine.startup_engine import load_benchmarks, run_startup_valuation
+from .responses import OrjsonResponse, TaggedBody, conditional_response, tagged_json
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/startup")
 
-_DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "startup_valuation_benchmarks.json")
+# The engine's parsed copy of the benchmark file — one parse per process, shared
+_benchmarks = load_benchmarks
+
+
+# Stage list is fixed, so it is serialized once at import
+_STAGES_BYTES = orjson.dumps([
+    {"value": "pre_seed", "label": "Pre-Seed", "description": "Idea through MVP; typically SAFE or convertible note"},
+    {"value": "seed", "label": "Seed", "description": "Early traction; priced round or SAFE up to ~$4M"},
+    {"value": "series_a", "label": "Series A", "description": "Scaling with proven product-market fit; $2M+ ARR typical"},
+])
 
 
 @router.post("/value", response_model=StartupValuationOutput, summary="Run startup valuation")
@@ -32,27 +41,50 @@ async def value_startup(inp: StartupInput) -> StartupValuationOutput:
     investor scorecard, and benchmark comparison for the given vertical and stage.
     """
     try:
-        logger.info(
-            "Valuing startup: %s — %s %s raise $%.2fM",
-            inp.company_name,
-            inp.fundraise.vertical.value,
-            inp.fundraise.stage.value,
-            inp.fundraise.raise_amount,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Valuing startup: %s — %s %s raise $%.2fM",
+                inp.company_name,
+                inp.fundraise.vertical.value,
+                inp.fundraise.stage.value,
+                inp.fundraise.raise_amount,
+            )
         result = run_startup_valuation(inp)
-        return JSONResponse(content=round_financial_output(result))
-    except ValidationError as e:
+        return OrjsonResponse(round_financial_output(result))
+    except ValidationError:
         raise HTTPException(status_code=422, detail="Invalid startup inputs. Please check your values.")
     except Exception:
         logger.exception("Startup valuation failed")
         raise HTTPException(status_code=500, detail="Startup valuation encountered an internal error. Please try again.")
 
 
-@router.get("/benchmarks", summary="Get benchmark data for a vertical and stage")
+@functools.cache
+def _benchmark_body(vertical: StartupVertical, stage: StartupStage) -> TaggedBody | None:
+    """Serialized /benchmarks payload for one vertical × stage, or None if there is no data."""
+    v_key, s_key = vertical.value, stage.value
+    data = _benchmarks()
+    vdata = data.get("verticals", {}).get(v_key, {})
+    stage_data = vdata.get(s_key, {})
+    if not stage_data:
+        return None
+    return tagged_json({
+        "vertical": v_key,
+        "vertical_label": vdata.get("label", v_key),
+        "stage": s_key,
+        "benchmarks": stage_data,
+        "market_wide": data.get("market_wide_medians", {}).get(s_key, {}),
+        "nrr_multiple_lookup": data.get("nrr_multiple_lookup", {}),
+        "burn_multiple_bands": data.get("burn_multiple_bands", {}),
+        "rule_of_40_bands": data.get("rule_of_40_bands", {}),
+    })
+
+
+@router.get("/benchmarks", response_model=dict, summary="Get benchmark data for a vertical and stage")
 async def get_benchmarks(
     vertical: StartupVertical,
     stage: StartupStage,
-) -> dict:
+    http_request: Request,
+) -> Response:
     """
     Return the raw benchmark data (P25/P50/P75/P95 valuations, ARR multiples, dilution)
     for a given startup vertical and fundraising stage.
@@ -61,25 +93,10 @@ async def get_benchmarks(
     provides custom inputs.
     """
     try:
-        with open(_DATA_PATH, "r") as f:
-            data = json.load(f)
-
-        vdata = data.get("verticals", {}).get(vertical.value, {})
-        stage_data = vdata.get(stage.value, {})
-
-        if not stage_data:
+        tagged = _benchmark_body(vertical, stage)
+        if tagged is None:
             raise HTTPException(status_code=404, detail=f"No benchmark data for vertical '{vertical.value}' at stage '{stage.value}'.")
-
-        return {
-            "vertical": vertical.value,
-            "vertical_label": vdata.get("label", vertical.value),
-            "stage": stage.value,
-            "benchmarks": stage_data,
-            "market_wide": data.get("market_wide_medians", {}).get(stage.value, {}),
-            "nrr_multiple_lookup": data.get("nrr_multiple_lookup", {}),
-            "burn_multiple_bands": data.get("burn_multiple_bands", {}),
-            "rule_of_40_bands": data.get("rule_of_40_bands", {}),
-        }
+        return conditional_response(http_request, tagged)
     except HTTPException:
         raise
     except Exception:
@@ -87,31 +104,41 @@ async def get_benchmarks(
         raise HTTPException(status_code=500, detail="Failed to retrieve benchmark data.")
 
 
-@router.get("/verticals", summary="List startup verticals")
-async def list_verticals() -> list[dict]:
+@functools.lru_cache(maxsize=1)
+def _verticals_body() -> TaggedBody:
+    """Serialized vertical list; labels come from the static benchmark file."""
+    verticals = _benchmarks().get("verticals", {})
+    rows = []
+    for v in StartupVertical:
+        key = v.value
+        entry = verticals.get(key, {})
+        rows.append({"value": key, "label": entry.get("label", key), "description": entry.get("description", "")})
+    return tagged_json(rows)
+
+
+def preload_benchmarks() -> None:
+    """
+    Fill the benchmark caches. Blocking file I/O — the app lifespan runs it in a
+    worker thread at startup so request handlers never touch the disk.
+    """
+    _benchmarks()
+    _verticals_body()
+    for vertical in StartupVertical:
+        for stage in StartupStage:
+            _benchmark_body(vertical, stage)
+
+
+@router.get("/verticals", response_model=list[dict], summary="List startup verticals")
+async def list_verticals(http_request: Request) -> Response:
     """Return all supported startup verticals with labels."""
     try:
-        with open(_DATA_PATH, "r") as f:
-            data = json.load(f)
-        verticals = data.get("verticals", {})
-        return [
-            {
-                "value": v.value,
-                "label": verticals.get(v.value, {}).get("label", v.value),
-                "description": verticals.get(v.value, {}).get("description", ""),
-            }
-            for v in StartupVertical
-        ]
+        return conditional_response(http_request, _verticals_body())
     except Exception:
         logger.exception("Failed to list verticals")
         raise HTTPException(status_code=500, detail="Failed to retrieve vertical list.")
 
 
-@router.get("/stages", summary="List startup funding stages")
-async def list_stages() -> list[dict]:
+@router.get("/stages", response_model=list[dict], summary="List startup funding stages")
+async def list_stages() -> Response:
     """Return all supported funding stages."""
-    return [
-        {"value": "pre_seed", "label": "Pre-Seed", "description": "Idea through MVP; typically SAFE or convertible note"},
-        {"value": "seed", "label": "Seed", "description": "Early traction; priced round or SAFE up to ~$4M"},
-        {"value": "series_a", "label": "Series A", "description": "Scaling with proven product-market fit; $2M+ ARR typical"},
-    ]
+    return Response(_STAGES_BYTES, media_type="application/json")
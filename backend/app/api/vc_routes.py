@@ -7,12 +7,12 @@ Answers the question every VC investor asks before writing a check:
 """
 from __future__ import annotations
 
-import json
+import functools
 import logging
-import os
+from dataclasses import dataclass
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import ValidationError
 
 from ..engine import round_financial_output
@@ -35,12 +35,26 @@ from ..engine.vc_return_engine import (
     run_bridge_analysis,
     compute_waterfall,
     compute_pro_rata,
+    load_benchmarks,
 )
+from .responses import OrjsonResponse, TaggedBody, conditional_response, tagged_json
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/vc")
 
-_DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "vc_benchmarks.json")
+# The engine's parsed copy of the benchmark file — one parse per process, shared
+_benchmarks = load_benchmarks
+
+
+# Stage list is fixed, so it is serialized once at import
+_STAGES_BYTES = orjson.dumps([
+    {"value": "pre_seed", "label": "Pre-Seed", "description": "Idea through MVP; < $3M raise"},
+    {"value": "seed", "label": "Seed", "description": "Early traction; $2-6M raise; SAFE or priced"},
+    {"value": "series_a", "label": "Series A", "description": "PMF proven; $8-25M; $1.5M+ ARR"},
+    {"value": "series_b", "label": "Series B", "description": "Scaling; $20-60M; $5M+ ARR"},
+    {"value": "series_c", "label": "Series C", "description": "Expansion; $40-100M+; $15M+ ARR"},
+    {"value": "growth", "label": "Growth / Late Stage", "description": "Pre-IPO / secondary; $100M+"},
+])
 
 
 # ---------------------------------------------------------------------------
@@ -67,20 +81,21 @@ async def evaluate_deal(request: DealEvalRequest) -> VCDealOutput:
     - Power law context
     """
     try:
-        logger.info(
-            "VC evaluation: %s | %s %s | $%.1fM @ $%.0fM post-money",
-            request.company_name,
-            request.vertical.value,
-            request.stage.value,
-            request.check_size,
-            request.post_money_valuation,
-        )
-        # Extract fund from request and create deal input
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "VC evaluation: %s | %s %s | $%.1fM @ $%.0fM post-money",
+                request.company_name,
+                request.vertical.value,
+                request.stage.value,
+                request.check_size,
+                request.post_money_valuation,
+            )
+        # The request is already a validated VCDealInput; the engine ignores the extra fund field
         fund = request.fund
-        deal = VCDealInput(**request.model_dump(exclude={"fund"}))
+        deal: VCDealInput = request
         result = run_vc_deal_evaluation(deal, fund)
-        return JSONResponse(content=round_financial_output(result))
-    except ValidationError as e:
+        return OrjsonResponse(round_financial_output(result))
+    except ValidationError:
         raise HTTPException(status_code=422, detail="Invalid deal or fund inputs.")
     except Exception:
         logger.exception("VC deal evaluation failed")
@@ -91,6 +106,40 @@ async def evaluate_deal(request: DealEvalRequest) -> VCDealOutput:
 # Fund profile defaults
 # ---------------------------------------------------------------------------
 
+@dataclass(frozen=True, slots=True)
+class _FundTemplate:
+    """Size-independent parts of a fund construction template."""
+    reserve_ratio: float
+    portfolio_count: int
+    target_ownership_pct: float
+    deployment_period_years: int
+    check_low: float
+    check_high: float
+
+
+@functools.lru_cache(maxsize=1)
+def _fund_templates() -> tuple[_FundTemplate, _FundTemplate, dict]:
+    """(seed template, Series A template, power-law context), resolved once."""
+    construction = _benchmarks().get("fund_construction", {})
+
+    def resolve(template: dict) -> _FundTemplate:
+        check_low, check_high = template.get("initial_check_range_usd_m", [1.0, 3.0])
+        return _FundTemplate(
+            reserve_ratio=template.get("reserve_ratio", 0.40),
+            portfolio_count=template.get("portfolio_count", [25, 40])[0],
+            target_ownership_pct=template.get("target_ownership_pct", 0.10),
+            deployment_period_years=template.get("deployment_period_years", 3),
+            check_low=check_low,
+            check_high=check_high,
+        )
+
+    return (
+        resolve(construction.get("typical_seed_fund", {})),
+        resolve(construction.get("typical_series_a_fund", {})),
+        construction.get("power_law_returns", {}),
+    )
+
+
 @router.get("/fund/defaults", summary="Get recommended fund profile defaults by fund size")
 async def get_fund_defaults(fund_size_usd_m: float) -> dict:
     """
@@ -99,18 +148,9 @@ async def get_fund_defaults(fund_size_usd_m: float) -> dict:
     Calibrated to Cambridge Associates / First Round Capital best practices.
     """
     try:
-        with open(_DATA_PATH, "r") as f:
-            benchmarks = json.load(f)
-
-        construction = benchmarks.get("fund_construction", {})
-
-        if fund_size_usd_m <= 100:
-            template = construction.get("typical_seed_fund", {})
-        else:
-            template = construction.get("typical_series_a_fund", {})
-
-        check_low, check_high = template.get("initial_check_range_usd_m", [1.0, 3.0])
-        target_check = (fund_size_usd_m - fund_size_usd_m * 0.10 * 5) * (1 - template.get("reserve_ratio", 0.40)) / template.get("portfolio_count", [25, 40])[0]
+        seed, series_a, power_law = _fund_templates()
+        tpl = seed if fund_size_usd_m <= 100 else series_a
+        target_check = (fund_size_usd_m - fund_size_usd_m * 0.10 * 5) * (1 - tpl.reserve_ratio) / tpl.portfolio_count
 
         return {
             "fund_size": fund_size_usd_m,
@@ -119,19 +159,19 @@ async def get_fund_defaults(fund_size_usd_m: float) -> dict:
                 "management_fee_years": 5,
                 "carry_pct": 0.20,
                 "hurdle_rate": 0.08,
-                "reserve_ratio": template.get("reserve_ratio", 0.40),
-                "target_initial_check_count": template.get("portfolio_count", [25, 40])[0],
-                "target_ownership_pct": template.get("target_ownership_pct", 0.10),
-                "deployment_period_years": template.get("deployment_period_years", 3),
+                "reserve_ratio": tpl.reserve_ratio,
+                "target_initial_check_count": tpl.portfolio_count,
+                "target_ownership_pct": tpl.target_ownership_pct,
+                "deployment_period_years": tpl.deployment_period_years,
                 "recycling_pct": 0.05,
             },
             "computed": {
                 "investable_capital": fund_size_usd_m - (fund_size_usd_m * 0.02 * 5),
                 "implied_initial_check": round(target_check, 2),
-                "initial_check_range": {"low": check_low, "high": check_high},
-                "reserve_pool": fund_size_usd_m * (1 - 0.10) * template.get("reserve_ratio", 0.40),
+                "initial_check_range": {"low": tpl.check_low, "high": tpl.check_high},
+                "reserve_pool": fund_size_usd_m * (1 - 0.10) * tpl.reserve_ratio,
             },
-            "power_law_context": benchmarks.get("fund_construction", {}).get("power_law_returns", {}),
+            "power_law_context": power_law,
         }
     except Exception:
         logger.exception("Failed to retrieve fund defaults")
@@ -150,7 +190,7 @@ async def analyze_portfolio(inp: PortfolioInput):
     """
     try:
         result = run_portfolio_analysis(inp)
-        return JSONResponse(content=round_financial_output(result))
+        return OrjsonResponse(round_financial_output(result))
     except Exception:
         logger.exception("Portfolio analysis failed")
         raise HTTPException(status_code=500, detail="Portfolio analysis failed.")
@@ -171,9 +211,9 @@ async def analyze_waterfall(request: WaterfallRequest):
     Returns per-class distribution amounts and optimal conversion decisions.
     """
     try:
-        deal = VCDealInput(**request.model_dump(exclude={"exit_ev"}))
+        deal: VCDealInput = request  # validated subclass; no dump/re-validate round trip
         result = compute_waterfall(deal, request.exit_ev)
-        return JSONResponse(content=round_financial_output(result))
+        return OrjsonResponse(round_financial_output(result))
     except Exception:
         logger.exception("Waterfall analysis failed")
         raise HTTPException(status_code=500, detail="Waterfall analysis failed.")
@@ -198,7 +238,7 @@ async def analyze_pro_rata(request: ProRataRequest):
     try:
         from ..engine.vc_return_engine import compute_ownership_math
         fund = request.fund
-        deal = VCDealInput(**request.model_dump(exclude={"fund", "next_round_valuation", "pro_rata_check"}))
+        deal: VCDealInput = request  # validated subclass; no dump/re-validate round trip
         ownership = compute_ownership_math(
             check_size=deal.check_size,
             post_money=deal.post_money_valuation,
@@ -207,10 +247,9 @@ async def analyze_pro_rata(request: ProRataRequest):
             fund_profile=fund,
             arr=deal.arr,
         )
-        with open(_DATA_PATH, "r") as f:
-            benchmarks = json.load(f)
+        benchmarks = _benchmarks()
         result = compute_pro_rata(deal, fund, ownership, request.next_round_valuation, request.pro_rata_check, benchmarks)
-        return JSONResponse(content=round_financial_output(result))
+        return OrjsonResponse(round_financial_output(result))
     except Exception:
         logger.exception("Pro-rata analysis failed")
         raise HTTPException(status_code=500, detail="Pro-rata analysis failed.")
@@ -228,7 +267,7 @@ async def check_qsbs(inp: QSBSInput):
     """
     try:
         result = run_qsbs_analysis(inp)
-        return JSONResponse(content=round_financial_output(result))
+        return OrjsonResponse(round_financial_output(result))
     except Exception:
         logger.exception("QSBS analysis failed")
         raise HTTPException(status_code=500, detail="QSBS analysis failed.")
@@ -246,7 +285,7 @@ async def analyze_anti_dilution(inp: AntiDilutionInput):
     """
     try:
         result = run_anti_dilution(inp)
-        return JSONResponse(content=round_financial_output(result))
+        return OrjsonResponse(round_financial_output(result))
     except Exception:
         logger.exception("Anti-dilution analysis failed")
         raise HTTPException(status_code=500, detail="Anti-dilution analysis failed.")
@@ -264,7 +303,7 @@ async def analyze_bridge(inp: BridgeRoundInput):
     """
     try:
         result = run_bridge_analysis(inp)
-        return JSONResponse(content=round_financial_output(result))
+        return OrjsonResponse(round_financial_output(result))
     except Exception:
         logger.exception("Bridge analysis failed")
         raise HTTPException(status_code=500, detail="Bridge analysis failed.")
@@ -274,11 +313,34 @@ async def analyze_bridge(inp: BridgeRoundInput):
 # Benchmark data
 # ---------------------------------------------------------------------------
 
-@router.get("/benchmarks", summary="Get VC benchmarks for a vertical and stage")
+@functools.cache
+def _benchmark_body(vertical: VCVertical, stage: VCStage) -> TaggedBody | None:
+    """Serialized /benchmarks payload for one vertical × stage, or None if there is no data."""
+    v_key, s_key = vertical.value, stage.value
+    data = _benchmarks()
+    vdata = data.get("verticals", {}).get(v_key, {})
+    stage_data = vdata.get(s_key, {})
+    if not stage_data:
+        return None
+    return tagged_json({
+        "vertical": v_key,
+        "vertical_label": vdata.get("label", v_key),
+        "stage": s_key,
+        "benchmarks": stage_data,
+        "exit_multiples": vdata.get("exit_multiples", {}),
+        "dilution": data.get("dilution_per_round", {}).get(s_key, {}),
+        "time_to_next_round": data.get("time_to_next_round", {}),
+        "transition_probabilities": data.get("stage_transition_probabilities", {}),
+        "burn_multiple_bands": data.get("burn_multiple_benchmarks", {}),
+    })
+
+
+@router.get("/benchmarks", response_model=dict, summary="Get VC benchmarks for a vertical and stage")
 async def get_benchmarks(
     vertical: VCVertical,
     stage: VCStage,
-) -> dict:
+    http_request: Request,
+) -> Response:
     """
     Return VC benchmark data for a given vertical and stage:
     - Median/P25/P75 post-money valuations
@@ -289,29 +351,13 @@ async def get_benchmarks(
     - Time-to-next-round data
     """
     try:
-        with open(_DATA_PATH, "r") as f:
-            data = json.load(f)
-
-        vdata = data.get("verticals", {}).get(vertical.value, {})
-        stage_data = vdata.get(stage.value, {})
-
-        if not stage_data:
+        tagged = _benchmark_body(vertical, stage)
+        if tagged is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"No benchmark data for vertical '{vertical.value}' at stage '{stage.value}'."
             )
-
-        return {
-            "vertical": vertical.value,
-            "vertical_label": vdata.get("label", vertical.value),
-            "stage": stage.value,
-            "benchmarks": stage_data,
-            "exit_multiples": vdata.get("exit_multiples", {}),
-            "dilution": data.get("dilution_per_round", {}).get(stage.value, {}),
-            "time_to_next_round": data.get("time_to_next_round", {}),
-            "transition_probabilities": data.get("stage_transition_probabilities", {}),
-            "burn_multiple_bands": data.get("burn_multiple_benchmarks", {}),
-        }
+        return conditional_response(http_request, tagged)
     except HTTPException:
         raise
     except Exception:
@@ -319,37 +365,45 @@ async def get_benchmarks(
         raise HTTPException(status_code=500, detail="Failed to retrieve VC benchmarks.")
 
 
-@router.get("/verticals", summary="List VC-supported verticals")
-async def list_vc_verticals() -> list[dict]:
+@functools.lru_cache(maxsize=1)
+def _verticals_body() -> TaggedBody:
+    """Serialized vertical list; labels come from the static benchmark file."""
+    verticals = _benchmarks().get("verticals", {})
+    rows = []
+    for v in VCVertical:
+        key = v.value
+        entry = verticals.get(key, {})
+        rows.append({"value": key, "label": entry.get("label", key), "description": entry.get("description", "")})
+    return tagged_json(rows)
+
+
+def preload_benchmarks() -> None:
+    """
+    Fill the benchmark caches. Blocking file I/O — the app lifespan runs it in a
+    worker thread at startup so request handlers never touch the disk.
+    """
+    _benchmarks()
+    _verticals_body()
+    for vertical in VCVertical:
+        for stage in VCStage:
+            _benchmark_body(vertical, stage)
+    _fund_templates()
+
+
+@router.get("/verticals", response_model=list[dict], summary="List VC-supported verticals")
+async def list_vc_verticals(http_request: Request) -> Response:
     """Return all supported startup verticals with labels and descriptions."""
     try:
-        with open(_DATA_PATH, "r") as f:
-            data = json.load(f)
-        verticals = data.get("verticals", {})
-        return [
-            {
-                "value": v.value,
-                "label": verticals.get(v.value, {}).get("label", v.value),
-                "description": verticals.get(v.value, {}).get("description", ""),
-            }
-            for v in VCVertical
-        ]
+        return conditional_response(http_request, _verticals_body())
     except Exception:
         logger.exception("Failed to list VC verticals")
         raise HTTPException(status_code=500, detail="Failed to retrieve VC vertical list.")
 
 
-@router.get("/stages", summary="List VC investment stages")
-async def list_vc_stages() -> list[dict]:
+@router.get("/stages", response_model=list[dict], summary="List VC investment stages")
+async def list_vc_stages() -> Response:
     """Return all supported investment stages."""
-    return [
-        {"value": "pre_seed", "label": "Pre-Seed", "description": "Idea through MVP; < $3M raise"},
-        {"value": "seed", "label": "Seed", "description": "Early traction; $2-6M raise; SAFE or priced"},
-        {"value": "series_a", "label": "Series A", "description": "PMF proven; $8-25M; $1.5M+ ARR"},
-        {"value": "series_b", "label": "Series B", "description": "Scaling; $20-60M; $5M+ ARR"},
-        {"value": "series_c", "label": "Series C", "description": "Expansion; $40-100M+; $15M+ ARR"},
-        {"value": "growth", "label": "Growth / Late Stage", "description": "Pre-IPO / secondary; $100M+"},
-    ]
+    return Response(_STAGES_BYTES, media_type="application/json")
 
 
 @router.get("/health", summary="VC engine health check")
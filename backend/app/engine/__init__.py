@@ -3,6 +3,23 @@ from .financial_engine import run_deal
 from .models import DealInput, DealOutput
 
 
+def _container(value, owned):
+    """
+    Return (container, owned) for a dict, list, or Pydantic model, else None.
+
+    Containers the caller passed in are shallow-copied before they are rounded
+    in place; trees produced by model_dump() are already private and are not.
+    """
+    if isinstance(value, dict):
+        return (value if owned else dict(value)), owned
+    if isinstance(value, list):
+        return (value if owned else list(value)), owned
+    dump = getattr(value, "model_dump", None)
+    if dump is not None:
+        return dump(), True
+    return None
+
+
 def round_financial_output(obj, decimals=6):
     """
     Recursively round all float values in a Pydantic model or dict to
@@ -11,16 +28,33 @@ def round_financial_output(obj, decimals=6):
     Uses 6 significant decimal places by default — enough for financial
     accuracy while eliminating 10+ decimal place artifacts like
     0.12300000000000001 → 0.123.
+
+    The tree is walked with an explicit stack and rounded in place, so deep
+    outputs neither grow the call stack nor rebuild every dict and list.
     """
     if isinstance(obj, float):
         return round(obj, decimals)
-    if isinstance(obj, dict):
-        return {k: round_financial_output(v, decimals) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [round_financial_output(item, decimals) for item in obj]
-    if hasattr(obj, "model_dump"):
-        return round_financial_output(obj.model_dump(), decimals)
-    return obj
+    found = _container(obj, False)
+    if found is None:
+        return obj
+    root = found[0]
+    stack = [found]
+    while stack:
+        node, owned = stack.pop()
+        for key, value in (node.items() if type(node) is dict else enumerate(node)):
+            kind = type(value)
+            if kind is float:
+                node[key] = round(value, decimals)
+            elif kind is str or kind is int or kind is bool or value is None:
+                continue
+            elif isinstance(value, float):
+                node[key] = round(value, decimals)
+            else:
+                child = _container(value, owned)
+                if child is not None:
+                    node[key] = child[0]
+                    stack.append(child)
+    return root
 
 
 __all__ = ["run_deal", "DealInput", "DealOutput", "round_financial_output"]
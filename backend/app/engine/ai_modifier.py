@@ -10,28 +10,32 @@ It never raises exceptions; errors are returned as pass-through outputs with war
 """
 from __future__ import annotations
 
-import json
 import logging
 import os
+from dataclasses import dataclass
 from typing import Optional
 
-from pydantic import BaseModel, Field
+import orjson
 
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Pydantic models
+# Data types
 # ---------------------------------------------------------------------------
+# Plain slotted dataclasses: the modifier is only called from inside the startup
+# engine, whose inputs are already validated at the API edge.
 
 
-class AIModifierInput(BaseModel):
+@dataclass(slots=True)
+class AIModifierInput:
     is_ai_native: bool
-    ai_native_score: float = Field(ge=0.0, le=1.0)
+    ai_native_score: float        # 0.0–1.0; clamped defensively below
     vertical: str
-    blended_valuation: float = Field(gt=0.0)
+    blended_valuation: float      # must be positive; non-positive → pass-through
 
 
-class AIModifierOutput(BaseModel):
+@dataclass(slots=True)
+class AIModifierOutput:
     blended_after_ai: float
     ai_premium_multiplier: Optional[float] = None
     ai_modifier_applied: bool = False
@@ -45,22 +49,31 @@ class AIModifierOutput(BaseModel):
 _DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "ai_toggle_config.json")
 
 
+_MEMBERSHIP_KEYS = ("frozen_on", "frozen_off", "default_on", "default_off")
+
+
 def _load_config() -> dict:
     try:
-        with open(_DATA_PATH, "r") as f:
-            return json.load(f)
-    except Exception as e:
-        logger.warning(f"Failed to load ai_toggle_config.json: {e}")
-        return {
-            "frozen_on": [],
-            "frozen_off": [],
-            "default_on": [],
-            "default_off": [],
-            "vertical_premiums": {},
+        with open(_DATA_PATH, "rb") as f:
+            config = orjson.loads(f.read())
+        # Flat str → float table so the hot path is a single dict get
+        config["vertical_premiums"] = {
+            vertical: float(premium) for vertical, premium in config.get("vertical_premiums", {}).items()
         }
+    except Exception as e:
+        logger.warning("Failed to load ai_toggle_config.json: %s", e)
+        config = {"vertical_premiums": {}}
+    # Vertical lists are only used for membership tests
+    for key in _MEMBERSHIP_KEYS:
+        config[key] = frozenset(config.get(key, ()))
+    return config
 
 
 _CONFIG = _load_config()
+_PREMIUMS: dict[str, float] = _CONFIG["vertical_premiums"]
+_FROZEN_ON: frozenset[str] = _CONFIG["frozen_on"]
+
+_FROZEN_ON_CONTEXT = "Vertical is AI-native by definition — premium already reflected in benchmarks"
 
 
 # ---------------------------------------------------------------------------
@@ -81,54 +94,31 @@ def apply_ai_modifier(inp: AIModifierInput) -> AIModifierOutput:
 
     Never raises — returns AIModifierOutput with ai_modifier_applied=False on any error.
     """
-    try:
-        # Clamp score to [0.0, 1.0] defensively
-        score = max(0.0, min(1.0, inp.ai_native_score))
+    # Pass-through fast path (rules 1–3): attribute reads and a set lookup only,
+    # so it runs ahead of the try block and allocates nothing but the result.
+    blended = inp.blended_valuation
+    if blended > 0:
+        if not inp.is_ai_native or inp.ai_native_score <= 0.0:
+            return AIModifierOutput(blended_after_ai=blended)
+        if inp.vertical in _FROZEN_ON:
+            return AIModifierOutput(blended_after_ai=blended, ai_premium_context=_FROZEN_ON_CONTEXT)
 
-        # Guard: blended_valuation must be positive
-        if inp.blended_valuation <= 0:
-            logger.warning("blended_valuation <= 0 (%s); returning pass-through", inp.blended_valuation)
+    try:
+        # Guard: blended_valuation must be positive (also rejects NaN)
+        if not blended > 0:
+            logger.warning("blended_valuation <= 0 (%s); returning pass-through", blended)
             return AIModifierOutput(
-                blended_after_ai=inp.blended_valuation,
+                blended_after_ai=blended,
                 ai_modifier_applied=False,
                 ai_premium_multiplier=None,
                 ai_premium_context="blended_valuation must be positive",
             )
 
-        # 1. Toggle is OFF
-        if not inp.is_ai_native:
-            return AIModifierOutput(
-                blended_after_ai=inp.blended_valuation,
-                ai_modifier_applied=False,
-                ai_premium_multiplier=None,
-                ai_premium_context=None,
-            )
-
-        # 2. Score is zero — no premium to apply
-        if score == 0.0:
-            return AIModifierOutput(
-                blended_after_ai=inp.blended_valuation,
-                ai_modifier_applied=False,
-                ai_premium_multiplier=None,
-                ai_premium_context=None,
-            )
-
-        # 3. Frozen-on verticals — premium already baked into benchmarks
-        frozen_on = _CONFIG.get("frozen_on", [])
-        if inp.vertical in frozen_on:
-            return AIModifierOutput(
-                blended_after_ai=inp.blended_valuation,
-                ai_modifier_applied=False,
-                ai_premium_multiplier=None,
-                ai_premium_context=(
-                    "Vertical is AI-native by definition — premium already reflected in benchmarks"
-                ),
-            )
+        # Clamp score to [0.0, 1.0] defensively
+        score = max(0.0, min(1.0, inp.ai_native_score))
 
         # 4. Vertical not found in vertical_premiums
-        vertical_premiums = _CONFIG.get("vertical_premiums", {})
-        base_premium = vertical_premiums.get(inp.vertical)
-        if base_premium is None:
+        if inp.vertical not in _PREMIUMS:
             logger.warning(
                 "Vertical '%s' not found in ai_toggle_config.json vertical_premiums; "
                 "treating as default_off with no premium",
@@ -144,16 +134,12 @@ def apply_ai_modifier(inp: AIModifierInput) -> AIModifierOutput:
             )
 
         # 5. Normal case: graduated premium
-        premium = base_premium * score
-        blended_after_ai = inp.blended_valuation * (1 + premium)
-
+        premium = _PREMIUMS[inp.vertical] * score
         return AIModifierOutput(
-            blended_after_ai=blended_after_ai,
+            blended_after_ai=blended * (1 + premium),
             ai_premium_multiplier=premium,
             ai_modifier_applied=True,
-            ai_premium_context=(
-                f"AI-native premium: {premium:.0%} applied ({inp.vertical} at score {score})"
-            ),
+            ai_premium_context=f"AI-native premium: {premium:.0%} applied ({inp.vertical} at score {score})",
         )
 
     except Exception as e:
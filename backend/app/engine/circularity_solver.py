@@ -12,7 +12,7 @@ We resolve this with an iterative approach using average-balance interest:
   4. Apply optional cash sweep (excess FCF) in waterfall order (highest rate first).
   5. Compute ending balances.
   6. Recompute interest on average balance ((BOY + EOY) / 2).
-  7. Compare to previous iteration; apply damping.
+  7. Compare to previous iteration; take a Newton step (damped fallback).
   8. Repeat until convergence or max iterations.
 
 NOTE: Prior convention used beginning-of-year (BOY) balances for interest, which
@@ -22,12 +22,29 @@ balance interest to model the full circularity accurately. The change is documen
 here per CLAUDE.md convention.
 
 Convergence tolerance: $1 or 0.01% of interest, whichever is smaller.
-Max iterations: 100. Damping factor: 0.5 (prevents oscillation).
+Max iterations: 100. Damping factor: 0.5 (fallback when a Newton step fails
+to shrink the residual).
+
+Newton update: with the tax and sweep regime fixed, the new interest estimate
+f(I) is linear in I. A dollar more interest cuts FCF by (1 − t), which comes
+off the sweep into the marginal (partially swept) tranche and raises its
+average balance by (1 − t)/2, so f'(I) = rate_marginal × (1 − t) / 2. The step
+I ← I + (f(I) − I) / (1 − f'(I)) lands on the fixed point in one iteration
+within a regime, so years typically converge in 2–3 iterations.
+
+Closed form: because f is piecewise linear, solve_year first solves each
+(tax sign, marginal tranche) regime for I directly and starts from the
+consistent one, so the loop normally confirms the fixed point in a single
+pass. Newton iteration remains as the fallback.
 """
 from __future__ import annotations
 
 import logging
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from typing import Iterable, NamedTuple
 
 from .models import DebtTranche, AmortizationType
 
@@ -36,10 +53,10 @@ logger = logging.getLogger(__name__)
 MAX_ITERATIONS = 100
 ABSOLUTE_TOLERANCE = 1.0          # $1
 RELATIVE_TOLERANCE = 0.0001       # 0.01%
-DAMPING = 0.5                     # Blend old/new estimate to prevent oscillation
+DAMPING = 0.5                     # Blend old/new estimate when Newton stalls
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DebtScheduleYear:
     """Debt schedule output for a single year, per tranche."""
     tranche_name: str
@@ -51,7 +68,7 @@ class DebtScheduleYear:
     interest_rate: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SolverResult:
     """Output of the circularity solver for a single projection year."""
     total_interest_expense: float
@@ -97,137 +114,204 @@ def _scheduled_principal(tranche: DebtTranche, year: int, current_balance: float
         return min(annual_principal, current_balance)
 
 
-def solve_year(
+def _mandatory_table(tranches: list[DebtTranche], projection_years: int) -> list[list[float]]:
+    """
+    Per-year scheduled principal caps for every tranche, built once per deal.
+
+    Row ``year - 1`` holds one entry per tranche; the mandatory payment is
+    ``min(entry, beginning balance)``. Straight-line entries are the fixed
+    annual amount; a balloon/final-year payoff is ``math.inf`` so it resolves to
+    whatever balance remains after earlier sweeps. Matches _scheduled_principal.
+    """
+    rows = [[0.0] * len(tranches) for _ in range(projection_years)]
+    for i, tranche in enumerate(tranches):
+        term = tranche.term_years
+        if tranche.amortization_type in (AmortizationType.INTEREST_ONLY, AmortizationType.BULLET):
+            if 1 <= term <= projection_years:
+                rows[term - 1][i] = math.inf
+        else:
+            annual_principal = tranche.amount / term
+            for year in range(1, min(term, projection_years) + 1):
+                rows[year - 1][i] = annual_principal
+    return rows
+
+
+def _regime_consistent(
+    interest: float,
+    low: float,
+    high: float | None,
+    ebit: float,
+    taxed: bool,
+    keep: float,
+    excess: float,
+) -> bool:
+    """
+    Whether a candidate interest figure satisfies the regime it was solved in.
+
+    The tax sign must match ``taxed`` and the cash left for the sweep
+    (excess - keep × I) must fall within [low, high]; ``high=None`` is unbounded.
+    """
+    if taxed != (ebit - interest > 0):
+        return False
+    available = excess - keep * interest
+    return available >= low and (high is None or available <= high)
+
+
+def _closed_form_interest(
+    ebit: float,
+    cash_adjustments: float,
+    total_mandatory: float,
+    tax_rate: float,
+    base_interest: float,
+    sweep_caps: list[float],
+    sweep_rates: list[float],
+) -> float | None:
+    """
+    Solve the average-balance circularity I = f(I) directly.
+
+    With the tax sign and the sweep position fixed, f is linear in I: every
+    tranche ahead of the marginal one is swept to zero, the marginal tranche
+    absorbs the rest of FCF, and the ones behind it take nothing. Each regime is
+    solved in closed form and the first self-consistent one is returned.
+
+    Args:
+        ebit: EBIT for the year.
+        cash_adjustments: D&A − CapEx − ΔNWC (FCF = NI + cash_adjustments).
+        total_mandatory: Mandatory principal across all tranches.
+        tax_rate: Effective tax rate.
+        base_interest: Interest with no optional sweep at all.
+        sweep_caps: Balance left after mandatory principal, in waterfall order.
+        sweep_rates: Interest rates, in the same order.
+
+    Returns:
+        Interest expense at the fixed point, or None if no regime is consistent
+        (float edge cases) — the caller then iterates.
+    """
+    for taxed in (True, False):
+        keep = 1.0 - tax_rate if taxed else 1.0
+        # Cash available for the sweep is excess - keep × I
+        excess = ebit * keep + cash_adjustments - total_mandatory
+
+        # No sweep: FCF does not cover mandatory principal
+        if _regime_consistent(base_interest, float("-inf"), 0.0, ebit, taxed, keep, excess):
+            return base_interest
+
+        swept = 0.0          # Balance swept ahead of the marginal tranche
+        saved = 0.0          # Interest saved on those tranches
+        for cap, rate in zip(sweep_caps, sweep_rates):
+            half = rate / 2.0
+            # Marginal tranche takes (excess - keep × I - swept) of sweep
+            interest = (base_interest - saved - half * (excess - swept)) / (1.0 - half * keep)
+            if _regime_consistent(interest, swept, swept + cap, ebit, taxed, keep, excess):
+                return interest
+            swept += cap
+            saved += half * cap
+
+        # Every tranche fully repaid by the sweep
+        interest = base_interest - saved
+        if _regime_consistent(interest, swept, None, ebit, taxed, keep, excess):
+            return interest
+    return None
+
+
+def _solve_year_kernel(
+    boy: list[float],
+    rates: list[float],
+    mandatory: list[float],
     ebitda: float,
     da: float,
     capex: float,
     working_capital_change: float,
     tax_rate: float,
-    tranche_balances: dict[str, float],
-    tranches: list[DebtTranche],
-    year: int,
-) -> SolverResult:
+    waterfall: list[int] | None = None,
+) -> tuple[list[float], bool, int, float, float, float]:
     """
-    Solve the debt/interest circularity for a single projection year.
-
-    The circular dependency:
-      EBITDA - DA - Interest = EBT → NI → FCF → Optional Debt Paydown
-      → Ending Balance → Average Balance → Interest  (circular)
-
-    Interest is computed on the average of beginning and ending balances
-    to capture the FCF → paydown → interest feedback loop within the year.
+    Numeric core of solve_year: plain floats and parallel per-tranche lists only.
 
     Args:
-        ebitda: EBITDA for the year (pre-interest, pre-tax).
-        da: Total D&A for the year.
-        capex: Total capex for the year.
-        working_capital_change: Change in NWC (positive = cash outflow).
-        tax_rate: Effective tax rate.
-        tranche_balances: Dict of tranche_name → beginning-of-year balance.
-        tranches: List of DebtTranche definitions.
-        year: Current projection year (1-indexed).
+        boy: Beginning-of-year balance per active tranche (all > 0).
+        rates: Interest rate per tranche.
+        mandatory: Scheduled principal per tranche.
+        ebitda, da, capex, working_capital_change, tax_rate: As for solve_year.
+        waterfall: Tranche indices by interest rate, highest first (stable for
+            ties). Computed here when not supplied by the caller.
 
     Returns:
-        SolverResult with converged interest expense, debt schedule, and FCF.
+        Tuple of (optional paydown per tranche, converged, iterations,
+        net income, free cash flow, last interest estimate).
     """
-    if not tranches:
-        return SolverResult(
-            total_interest_expense=0.0,
-            total_debt_paydown=0.0,
-            optional_cash_sweep=0.0,
-            ending_debt_balance=0.0,
-            tranche_schedules=[],
-            converged=True,
-            iterations=0,
-            net_income=max(0.0, (ebitda - da) * (1 - tax_rate)),
-            free_cash_flow=max(0.0, (ebitda - da) * (1 - tax_rate)) + da - capex - working_capital_change,
-        )
-
-    # Mandatory principal per tranche (fixed, independent of interest)
-    tranche_mandatory: dict[str, float] = {}
-    total_mandatory = 0.0
-    for tranche in tranches:
-        bal = tranche_balances.get(tranche.name, 0.0)
-        if bal <= 0:
-            tranche_mandatory[tranche.name] = 0.0
-            continue
-        principal = _scheduled_principal(tranche, year, bal)
-        tranche_mandatory[tranche.name] = principal
-        total_mandatory += principal
+    n = len(boy)
+    total_mandatory = sum(mandatory)
+    after_mandatory = [b - m for b, m in zip(boy, mandatory)]
 
     # Initial interest guess: BOY balances × rate (no paydown yet)
-    prev_interest = sum(
-        tranche_balances.get(t.name, 0.0) * t.interest_rate
-        for t in tranches
-        if tranche_balances.get(t.name, 0.0) > 0
+    prev_interest = sum(b * r for b, r in zip(boy, rates))
+
+    # Waterfall order: highest interest rate first for optional paydown
+    # (tranches already retired by mandatory principal take no sweep)
+    if waterfall is None:
+        waterfall = sorted(range(n), key=rates.__getitem__, reverse=True)
+    sweep_order = [i for i in waterfall if after_mandatory[i] > 0]
+
+    # Iteration-invariant terms. Tranches outside the sweep order never take an
+    # optional paydown, so their ending balance and interest are fixed for the
+    # year; only the swept tranches are recomputed inside the loop.
+    ebit = ebitda - da
+    non_cash_and_capital = da - capex - working_capital_change
+    fixed_interest = sum(
+        (b + max(0.0, after)) / 2.0 * r
+        for b, after, r in zip(boy, after_mandatory, rates)
+        if not after > 0
+    )
+
+    # Start from the exact fixed point when it can be found directly; the loop
+    # then only confirms it (one pass) and fills in the schedule
+    closed_form = _closed_form_interest(
+        ebit,
+        non_cash_and_capital,
+        total_mandatory,
+        tax_rate,
+        fixed_interest + sum((boy[i] + after_mandatory[i]) / 2.0 * rates[i] for i in sweep_order),
+        [after_mandatory[i] for i in sweep_order],
+        [rates[i] for i in sweep_order],
     )
+    if closed_form is not None:
+        prev_interest = closed_form
 
     converged = False
     iterations = 0
-    final_schedules: list[DebtScheduleYear] = []
+    optional = [0.0] * n
     final_ni = 0.0
     final_fcf = 0.0
-
-    # Waterfall order: highest interest rate first for optional paydown
-    sorted_tranches = sorted(tranches, key=lambda t: t.interest_rate, reverse=True)
+    last_abs_diff = float("inf")
 
     for iteration in range(MAX_ITERATIONS):
         iterations = iteration + 1
 
         # Step 1: compute NI and FCF with current interest estimate
-        ebit = ebitda - da
         ebt = ebit - prev_interest
         taxes = max(0.0, ebt * tax_rate)
         net_income = ebt - taxes
-        fcf = net_income + da - capex - working_capital_change
-
-        # Step 2: optional cash sweep — excess FCF after mandatory amortization
-        optional_available = max(0.0, fcf - total_mandatory)
-        tranche_optional: dict[str, float] = {t.name: 0.0 for t in tranches}
-        remaining = optional_available
-        for tranche in sorted_tranches:
-            if remaining <= 0:
-                break
-            boy_bal = tranche_balances.get(tranche.name, 0.0)
-            after_mandatory = boy_bal - tranche_mandatory.get(tranche.name, 0.0)
-            if after_mandatory <= 0:
-                continue
-            sweep = min(remaining, after_mandatory)
-            tranche_optional[tranche.name] = sweep
+        fcf = net_income + non_cash_and_capital
+
+        # Steps 2–3: optional cash sweep of FCF after mandatory amortization, in
+        # waterfall order, then average-balance interest on the swept tranches
+        # (average balance captures the timing of paydown within the year)
+        remaining = max(0.0, fcf - total_mandatory)
+        total_new_interest = fixed_interest
+        marginal_rate = 0.0
+        for i in sweep_order:
+            if 0.0 < remaining < after_mandatory[i]:
+                marginal_rate = rates[i]
+            sweep = min(remaining, after_mandatory[i]) if remaining > 0 else 0.0
             remaining -= sweep
-
-        # Step 3: compute ending balances and average-balance interest
-        total_new_interest = 0.0
-        schedules: list[DebtScheduleYear] = []
-
-        for tranche in tranches:
-            boy_bal = tranche_balances.get(tranche.name, 0.0)
-            if boy_bal <= 0:
-                continue
-            mandatory = tranche_mandatory.get(tranche.name, 0.0)
-            optional_sweep = tranche_optional.get(tranche.name, 0.0)
-            ending_bal = max(0.0, boy_bal - mandatory - optional_sweep)
-
-            # Average balance captures the timing of paydown within the year
-            avg_balance = (boy_bal + ending_bal) / 2.0
-            interest = avg_balance * tranche.interest_rate
-            total_new_interest += interest
-
-            schedules.append(DebtScheduleYear(
-                tranche_name=tranche.name,
-                beginning_balance=boy_bal,
-                scheduled_principal=mandatory,
-                optional_paydown=optional_sweep,
-                interest_expense=interest,
-                ending_balance=ending_bal,
-                interest_rate=tranche.interest_rate,
-            ))
+            optional[i] = sweep
+            total_new_interest += (boy[i] + after_mandatory[i] - sweep) / 2.0 * rates[i]
 
         # Step 4: check convergence
         abs_diff = abs(total_new_interest - prev_interest)
         rel_diff = abs_diff / max(abs(prev_interest), 1.0)
 
-        final_schedules = schedules
         final_ni = net_income
         final_fcf = fcf
 
@@ -235,8 +319,91 @@ def solve_year(
             converged = True
             break
 
-        # Apply damping: blend old and new to prevent oscillation
-        prev_interest = DAMPING * prev_interest + (1.0 - DAMPING) * total_new_interest
+        if abs_diff < last_abs_diff:
+            # Newton step on g(I) = f(I) − I; f'(I) < 0.5 so the denominator stays > 0.5
+            slope = marginal_rate * (1.0 - (tax_rate if taxes > 0 else 0.0)) / 2.0
+            prev_interest += (total_new_interest - prev_interest) / (1.0 - slope)
+        else:
+            # Residual did not shrink (regime change): blend old and new instead
+            prev_interest = DAMPING * prev_interest + (1.0 - DAMPING) * total_new_interest
+        last_abs_diff = abs_diff
+
+    return optional, converged, iterations, final_ni, final_fcf, prev_interest
+
+
+def _no_debt_result(
+    ebitda: float,
+    da: float,
+    capex: float,
+    working_capital_change: float,
+    tax_rate: float,
+) -> SolverResult:
+    """SolverResult for a deal with no debt tranches at all."""
+    return SolverResult(
+        total_interest_expense=0.0,
+        total_debt_paydown=0.0,
+        optional_cash_sweep=0.0,
+        ending_debt_balance=0.0,
+        tranche_schedules=[],
+        converged=True,
+        iterations=0,
+        net_income=max(0.0, (ebitda - da) * (1 - tax_rate)),
+        free_cash_flow=max(0.0, (ebitda - da) * (1 - tax_rate)) + da - capex - working_capital_change,
+    )
+
+
+def _solve_active(
+    names: list[str],
+    boy: list[float],
+    rates: list[float],
+    mandatory: list[float],
+    ebitda: float,
+    da: float,
+    capex: float,
+    working_capital_change: float,
+    tax_rate: float,
+    year: int,
+    waterfall: list[int] | None = None,
+) -> SolverResult:
+    """Run the kernel over the active tranches and build the year's SolverResult."""
+    if not boy:
+        # All debt retired: no circularity left to solve. Same NI/FCF as the
+        # kernel at zero interest (losses are not floored, unlike _no_debt_result).
+        ebt = ebitda - da
+        net_income = ebt - max(0.0, ebt * tax_rate)
+        return SolverResult(
+            total_interest_expense=0.0,
+            total_debt_paydown=0.0,
+            optional_cash_sweep=0.0,
+            ending_debt_balance=0.0,
+            tranche_schedules=[],
+            converged=True,
+            iterations=0,
+            net_income=net_income,
+            free_cash_flow=net_income + (da - capex - working_capital_change),
+        )
+
+    optional, converged, iterations, final_ni, final_fcf, last_interest = _solve_year_kernel(
+        boy, rates, mandatory, ebitda, da, capex, working_capital_change, tax_rate, waterfall,
+    )
+
+    # Materialize the per-tranche schedule from the final iteration
+    ending = [max(0.0, b - m - o) for b, m, o in zip(boy, mandatory, optional)]
+    interest = [(b + e) / 2.0 * r for b, e, r in zip(boy, ending, rates)]
+    final_schedules = [
+        DebtScheduleYear(
+            tranche_name=tranche_name,
+            beginning_balance=b,
+            scheduled_principal=m,
+            optional_paydown=o,
+            interest_expense=i,
+            ending_balance=e,
+            interest_rate=r,
+        )
+        for tranche_name, b, m, o, i, e, r in zip(
+            names, boy, mandatory, optional, interest, ending, rates,
+        )
+    ]
 
     if not converged:
         logger.warning(
@@ -244,20 +411,18 @@ def solve_year(
             "Using best estimate: interest=$%.0f",
             MAX_ITERATIONS,
             year,
-            prev_interest,
+            last_interest,
         )
 
-    # Compute totals from final converged schedule
-    total_interest_final = sum(s.interest_expense for s in final_schedules)
-    total_mandatory_final = sum(s.scheduled_principal for s in final_schedules)
-    total_optional_final = sum(s.optional_paydown for s in final_schedules)
-    ending_debt_final = sum(s.ending_balance for s in final_schedules)
+    # Totals straight from the per-tranche lists (no schedule attribute access)
+    total_mandatory_final = sum(mandatory)
+    total_optional_final = sum(optional)
 
     return SolverResult(
-        total_interest_expense=total_interest_final,
+        total_interest_expense=sum(interest),
         total_debt_paydown=total_mandatory_final + total_optional_final,
         optional_cash_sweep=total_optional_final,
-        ending_debt_balance=ending_debt_final,
+        ending_debt_balance=sum(ending),
         tranche_schedules=final_schedules,
         converged=converged,
         iterations=iterations,
@@ -266,6 +431,64 @@ def solve_year(
     )
 
 
+def solve_year(
+    ebitda: float,
+    da: float,
+    capex: float,
+    working_capital_change: float,
+    tax_rate: float,
+    tranche_balances: dict[str, float],
+    tranches: list[DebtTranche],
+    year: int,
+) -> SolverResult:
+    """
+    Solve the debt/interest circularity for a single projection year.
+
+    The circular dependency:
+      EBITDA - DA - Interest = EBT → NI → FCF → Optional Debt Paydown
+      → Ending Balance → Average Balance → Interest  (circular)
+
+    Interest is computed on the average of beginning and ending balances
+    to capture the FCF → paydown → interest feedback loop within the year.
+
+    Args:
+        ebitda: EBITDA for the year (pre-interest, pre-tax).
+        da: Total D&A for the year.
+        capex: Total capex for the year.
+        working_capital_change: Change in NWC (positive = cash outflow).
+        tax_rate: Effective tax rate.
+        tranche_balances: Dict of tranche_name → beginning-of-year balance.
+        tranches: List of DebtTranche definitions.
+        year: Current projection year (1-indexed).
+
+    Returns:
+        SolverResult with converged interest expense, debt schedule, and FCF.
+    """
+    if not tranches:
+        return _no_debt_result(ebitda, da, capex, working_capital_change, tax_rate)
+
+    # Per-tranche state as parallel lists (structure of arrays), built once per
+    # year. Only tranches with a positive BOY balance take part; the kernel
+    # then works on plain floats and indices — no dict lookups, no attribute
+    # access, and no schedule objects until it has finished.
+    # (one name lookup per tranche; everything after this is positional)
+    active: list[DebtTranche] = []
+    boy: list[float] = []
+    for t in tranches:
+        balance = tranche_balances.get(t.name, 0.0)
+        if balance > 0:
+            active.append(t)
+            boy.append(balance)
+    rates = [t.interest_rate for t in active]
+
+    # Mandatory principal per tranche (fixed, independent of interest)
+    mandatory = [_scheduled_principal(t, year, b) for t, b in zip(active, boy)]
+    return _solve_active(
+        [t.name for t in active], boy, rates, mandatory,
+        ebitda, da, capex, working_capital_change, tax_rate, year,
+    )
+
+
 def build_debt_schedule(
     tranches: list[DebtTranche],
     projection_years: int,
@@ -297,8 +520,15 @@ def build_debt_schedule(
     if wc_change_by_year is None:
         wc_change_by_year = [0.0] * projection_years
 
-    # Initialize balances from original tranche amounts
-    balances: dict[str, float] = {t.name: t.amount for t in tranches}
+    # Balances are positional (one slot per tranche) and tranche attributes are
+    # read once, so each year only gathers the tranches still carrying debt and
+    # hands plain lists to the solver — no per-year dict rebuild.
+    names = [t.name for t in tranches]
+    rates = [t.interest_rate for t in tranches]
+    balances = [t.amount for t in tranches]
+    mandatory_by_year = _mandatory_table(tranches, projection_years)
+    # Rates never change, so the sweep waterfall (highest rate first) is sorted once
+    waterfall = sorted(range(len(tranches)), key=rates.__getitem__, reverse=True)
 
     for year in range(1, projection_years + 1):
         ebitda = ebitda_by_year[year - 1] if year <= len(ebitda_by_year) else 0.0
@@ -306,27 +536,79 @@ def build_debt_schedule(
         capex = capex_by_year[year - 1] if year <= len(capex_by_year) else 0.0
         wc_change = wc_change_by_year[year - 1] if year <= len(wc_change_by_year) else 0.0
 
-        result = solve_year(
-            ebitda=ebitda,
-            da=da,
-            capex=capex,
-            working_capital_change=wc_change,
-            tax_rate=tax_rate,
-            tranche_balances=balances,
-            tranches=tranches,
-            year=year,
+        if not tranches:
+            results.append(_no_debt_result(ebitda, da, capex, wc_change, tax_rate))
+            continue
+
+        active = [i for i, b in enumerate(balances) if b > 0]
+        if len(active) == len(tranches):
+            active_waterfall = waterfall
+        else:
+            position = {i: k for k, i in enumerate(active)}
+            active_waterfall = [position[i] for i in waterfall if i in position]
+        result = _solve_active(
+            [names[i] for i in active],
+            [balances[i] for i in active],
+            [rates[i] for i in active],
+            [min(mandatory_by_year[year - 1][i], balances[i]) for i in active],
+            ebitda, da, capex, wc_change, tax_rate, year, active_waterfall,
         )
 
         if not result.converged:
             any_non_convergence = True
 
-        # Roll forward balances from this year's ending balances
-        balances = {s.tranche_name: s.ending_balance for s in result.tranche_schedules}
-        # Zero out tranches not in schedules (fully paid or had zero balance)
-        for t in tranches:
-            if t.name not in balances:
-                balances[t.name] = 0.0
+        # Roll forward: tranches not in this year's schedule stay at zero
+        balances = [0.0] * len(tranches)
+        for i, sched in zip(active, result.tranche_schedules):
+            balances[i] = sched.ending_balance
 
         results.append(result)
 
     return results, any_non_convergence
+
+
+class DebtScheduleInputs(NamedTuple):
+    """Arguments of build_debt_schedule for one deal, packed for batch runs."""
+    tranches: list[DebtTranche]
+    projection_years: int
+    ebitda_by_year: list[float]
+    da_by_year: list[float]
+    capex_by_year: list[float]
+    tax_rate: float
+    wc_change_by_year: list[float] | None = None
+
+
+def _build_packed(inputs: DebtScheduleInputs) -> tuple[list[SolverResult], bool]:
+    return build_debt_schedule(*inputs)
+
+
+def build_debt_schedule_batch(
+    deals: Iterable[DebtScheduleInputs],
+    max_workers: int = 0,
+) -> list[tuple[list[SolverResult], bool]]:
+    """
+    Build debt schedules for many independent deals (portfolio / grid sweeps).
+
+    Deals share no state, so with max_workers > 0 they fan out across a
+    process pool (the solver is pure Python and holds the GIL, so threads would
+    not help). max_workers=0 runs them in-process, which is faster for small
+    batches where worker start-up dominates.
+
+    Args:
+        deals: One DebtScheduleInputs per deal.
+        max_workers: Worker processes to use; 0 runs sequentially.
+
+    Returns:
+        build_debt_schedule's (results, any_non_convergence) per deal, in input order.
+    """
+    deals = list(deals)
+    if max_workers <= 0 or len(deals) < 2:
+        return [_build_packed(d) for d in deals]
+
+    workers = min(max_workers, len(deals))
+    # spawn, not fork: callers may be running an event loop or helper threads
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        return list(pool.map(_build_packed, deals, chunksize=max(1, len(deals) // (workers * 4))))
@@ -5,11 +5,14 @@ Damodaran, PitchBook, and sector-specific public comps).
 """
 from __future__ import annotations
 
-import json
 import os
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from dataclasses import dataclass, replace
+from functools import cache
 from typing import Optional
 
+import orjson
+
 from .models import Industry
 
 
@@ -28,6 +31,8 @@ FEE_TIERS = [
     (500_000_000, 0.020),     # $50M–$500M → ~2%
     (float("inf"), 0.015),    # > $500M → ~1.5%
 ]
+_FEE_THRESHOLDS = tuple(threshold for threshold, _ in FEE_TIERS)
+_FEE_RATES = tuple(rate for _, rate in FEE_TIERS)
 
 _BENCHMARKS: Optional[dict] = None
 
@@ -37,19 +42,19 @@ def _load_benchmarks() -> dict:
     if _BENCHMARKS is None:
         data_dir = os.path.join(os.path.dirname(__file__), "..", "data")
         path = os.path.join(data_dir, "industry_benchmarks.json")
-        with open(path) as f:
-            _BENCHMARKS = json.load(f)
+        with open(path, "rb") as f:
+            _BENCHMARKS = orjson.loads(f.read())
     return _BENCHMARKS
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DefaultAssumptions:
     """Smart default assumptions for a given deal context."""
     # Financing
     tax_rate: float = 0.25
     transaction_fees_pct: float = 0.02
     blended_interest_rate: float = 0.08
-    interest_rate_range: tuple[float, float] = field(default_factory=lambda: (0.07, 0.09))
+    interest_rate_range: tuple[float, float] = (0.07, 0.09)
 
     # Industry benchmarks
     ebitda_margin: float = 0.15
@@ -76,10 +81,8 @@ class DefaultAssumptions:
 
 def get_transaction_fee_pct(deal_size: float) -> float:
     """Return typical transaction fees as % of deal size, scaled by deal size."""
-    for threshold, rate in FEE_TIERS:
-        if deal_size < threshold:
-            return rate
-    return 0.015
+    tier = bisect_right(_FEE_THRESHOLDS, deal_size)
+    return _FEE_RATES[tier] if tier < len(_FEE_RATES) else 0.015
 
 
 def get_interest_rate(deal_size: float) -> float:
@@ -89,6 +92,34 @@ def get_interest_rate(deal_size: float) -> float:
     return BLENDED_LARGE_CAP_RATE
 
 
+@cache
+def _industry_defaults(industry: Industry) -> DefaultAssumptions:
+    """Industry-specific part of the defaults, built once per industry."""
+    benchmarks = _load_benchmarks()
+    ind = benchmarks.get(industry.value, benchmarks["Manufacturing"])  # fallback
+    ev_ebitda = ind.get("ev_ebitda_multiple_range", {})
+
+    return DefaultAssumptions(
+        tax_rate=0.25,  # US federal + blended state
+        ebitda_margin=ind.get("typical_ebitda_margin", 0.15),
+        gross_margin=ind.get("typical_gross_margin", 0.45),
+        sga_pct_revenue=ind.get("typical_sga_pct_revenue", 0.20),
+        working_capital_pct_revenue=ind.get("typical_working_capital_pct_revenue", 0.10),
+        capex_pct_revenue=ind.get("typical_capex_pct_revenue", 0.03),
+        da_pct_revenue=ind.get("typical_da_pct_revenue", 0.04),
+        ev_ebitda_low=ev_ebitda.get("low", 6.0),
+        ev_ebitda_median=ev_ebitda.get("median", 9.0),
+        ev_ebitda_high=ev_ebitda.get("high", 13.0),
+        revenue_growth_rate=ind.get("typical_revenue_growth_rate", 0.05),
+        debt_capacity_turns=ind.get("typical_debt_capacity_turns_ebitda", 4.0),
+        back_office_synergy_pct_sga=0.03,
+        procurement_synergy_pct_cogs=0.02,
+        facility_synergy_pct_revenue=0.01,
+        asset_writeup_pct_ppe=0.10,
+        intangible_pct_purchase_price=0.15,
+    )
+
+
 def get_defaults(
     industry: Industry,
     deal_size: float,
@@ -105,40 +136,16 @@ def get_defaults(
     Returns:
         DefaultAssumptions populated with industry-specific benchmarks.
     """
-    benchmarks = _load_benchmarks()
-    industry_key = industry.value
-    ind = benchmarks.get(industry_key, benchmarks["Manufacturing"])  # fallback
-
-    tax_rate = 0.25  # US federal + blended state
-    tx_fee_pct = get_transaction_fee_pct(deal_size)
-    interest_rate = get_interest_rate(deal_size)
-
     if deal_size < 250_000_000:
         rate_range = MIDDLE_MARKET_RATE_RANGE
     else:
         rate_range = LARGE_CAP_RATE_RANGE
 
-    ev_ebitda = ind.get("ev_ebitda_multiple_range", {})
-
-    return DefaultAssumptions(
-        tax_rate=tax_rate,
-        transaction_fees_pct=tx_fee_pct,
-        blended_interest_rate=interest_rate,
+    # Only the financing terms depend on deal size; the rest is per industry.
+    # replace() returns a fresh instance, so the cached base is never shared.
+    return replace(
+        _industry_defaults(industry),
+        transaction_fees_pct=get_transaction_fee_pct(deal_size),
+        blended_interest_rate=get_interest_rate(deal_size),
         interest_rate_range=rate_range,
-        ebitda_margin=ind.get("typical_ebitda_margin", 0.15),
-        gross_margin=ind.get("typical_gross_margin", 0.45),
-        sga_pct_revenue=ind.get("typical_sga_pct_revenue", 0.20),
-        working_capital_pct_revenue=ind.get("typical_working_capital_pct_revenue", 0.10),
-        capex_pct_revenue=ind.get("typical_capex_pct_revenue", 0.03),
-        da_pct_revenue=ind.get("typical_da_pct_revenue", 0.04),
-        ev_ebitda_low=ev_ebitda.get("low", 6.0),
-        ev_ebitda_median=ev_ebitda.get("median", 9.0),
-        ev_ebitda_high=ev_ebitda.get("high", 13.0),
-        revenue_growth_rate=ind.get("typical_revenue_growth_rate", 0.05),
-        debt_capacity_turns=ind.get("typical_debt_capacity_turns_ebitda", 4.0),
-        back_office_synergy_pct_sga=0.03,
-        procurement_synergy_pct_cogs=0.02,
-        facility_synergy_pct_revenue=0.01,
-        asset_writeup_pct_ppe=0.10,
-        intangible_pct_purchase_price=0.15,
     )
@@ -13,14 +13,19 @@ Takes a DealInput and returns a DealOutput by:
 """
 from __future__ import annotations
 
-import json
+import functools
 import math
 import os
+from concurrent.futures import Executor
+from dataclasses import dataclass
 from datetime import date
 from typing import Callable
 
+import orjson
+
 from .models import (
     AccretionDilutionBridge,
+    AmortizationType,
     BalanceSheetAtClose,
     ContributionAnalysis,
     ContributionRow,
@@ -43,18 +48,34 @@ from .purchase_price import compute_ppa, get_transaction_costs
 from .returns import compute_returns
 from .risk_analyzer import analyze_risks
 from .sensitivity import generate_all_sensitivity_matrices
-from .defaults import get_defaults
+from .defaults import get_defaults, get_interest_rate
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Organic growth assumed for the acquirer on a standalone basis. Read by both
+# run_deal's projection and the Year 1 sensitivity fast path.
+_ACQUIRER_REVENUE_GROWTH = 0.03
+_STANDALONE_EPS_GROWTH = 0.03
+
+# Scorecard synergy NPV: 1.10 ** yr for years 1–5 (10% discount rate)
+_SYNERGY_DISCOUNT_FACTORS = tuple(1.10 ** yr for yr in range(1, 6))
+
+
+@functools.lru_cache(maxsize=1)
 def _load_benchmarks() -> dict:
+    """
+    Parsed industry_benchmarks.json, read once per process.
+
+    Every run_deal (including each sensitivity re-run) uses it, and callers only
+    read from it, so the cached dict is shared rather than copied.
+    """
     data_dir = os.path.join(os.path.dirname(__file__), "..", "data")
     path = os.path.join(data_dir, "industry_benchmarks.json")
-    with open(path) as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 def _synergy_year_value(items: list[SynergyItem], year: int) -> float:
@@ -64,6 +85,8 @@ def _synergy_year_value(items: list[SynergyItem], year: int) -> float:
     Each synergy item phases in linearly over phase_in_years.
     Year 1 = 1/N of run-rate, Year 2 = 2/N, ..., Year N = full run-rate.
     """
+    if not items:
+        return 0.0
     total = 0.0
     for item in items:
         if item.phase_in_years <= 0:
@@ -74,14 +97,38 @@ def _synergy_year_value(items: list[SynergyItem], year: int) -> float:
     return total
 
 
+def _synergy_terms(items: list[SynergyItem]) -> tuple[list[float], list[int]]:
+    """Synergy items as parallel (annual_amount, phase_in_years) lists, read once."""
+    return [item.annual_amount for item in items], [item.phase_in_years for item in items]
+
+
+def _synergy_by_year(amounts: list[float], phases: list[int], n_years: int) -> list[float]:
+    """
+    _synergy_year_value for years 1..n_years in one pass, over _synergy_terms lists.
+
+    The per-year accumulation is otherwise identical, so the totals match
+    _synergy_year_value call for call.
+    """
+    if not amounts:
+        # Most deals leave one (or both) synergy lists empty
+        return [0.0] * n_years
+    by_year: list[float] = []
+    for year in range(1, n_years + 1):
+        total = 0.0
+        for amount, phase_in_years in zip(amounts, phases):
+            if phase_in_years <= 0:
+                total += amount
+            else:
+                total += amount * min(1.0, year / phase_in_years)
+        by_year.append(total)
+    return by_year
+
+
 def _build_synthetic_tranches(deal: DealInput) -> list[DebtTranche]:
     """
     If the deal has no explicit debt tranches, build a single synthetic tranche
     from the deal structure using smart-default interest rates.
     """
-    from .defaults import get_interest_rate
-    from .models import AmortizationType
-
     acq_debt = deal.target.acquisition_price * deal.structure.debt_percentage
     if acq_debt <= 0:
         return []
@@ -124,10 +171,45 @@ def _format_pct(value: float) -> str:
     return f"{value:+.1f}%"
 
 
+def _health(value: float, low: float, mid: float, high: float, higher_is_better: bool = True) -> HealthStatus:
+    """Scorecard status of a value against its benchmark band."""
+    if higher_is_better:
+        if value >= mid:
+            return HealthStatus.GOOD
+        if value >= low:
+            return HealthStatus.FAIR
+        return HealthStatus.POOR
+    if value <= mid:
+        return HealthStatus.GOOD
+    if value <= high:
+        return HealthStatus.FAIR
+    return HealthStatus.POOR
+
+
 # ---------------------------------------------------------------------------
 # Defense-specific computation
 # ---------------------------------------------------------------------------
 
+# Certification display names → industry_benchmarks.json premium keys
+_CERT_KEY_MAP = {
+    "FedRAMP Moderate": "fedramp_moderate",
+    "FedRAMP High": "fedramp_high",
+    "IL4": "il4",
+    "IL5": "il5",
+    "IL6": "il6",
+    "CMMC Level 2": "cmmc_level_2",
+    "CMMC Level 3": "cmmc_level_3",
+}
+
+_CLEARANCE_LABELS = {
+    "unclassified": "Unclassified",
+    "secret": "Secret",
+    "top_secret": "Top Secret",
+    "ts_sci": "Top Secret/SCI",
+    "sap": "SAP",
+}
+
+
 def _compute_defense_positioning(deal: DealInput, benchmarks: dict) -> DefensePositioning | None:
     """
     Compute defense-specific positioning metrics when the target is in
@@ -155,17 +237,8 @@ def _compute_defense_positioning(deal: DealInput, benchmarks: dict) -> DefensePo
     # Certification premium — sum applicable certifications
     cert_premiums = defense_bench.get("certification_premium_pct", {})
     certification_premium = 0.0
-    cert_key_map = {
-        "FedRAMP Moderate": "fedramp_moderate",
-        "FedRAMP High": "fedramp_high",
-        "IL4": "il4",
-        "IL5": "il5",
-        "IL6": "il6",
-        "CMMC Level 2": "cmmc_level_2",
-        "CMMC Level 3": "cmmc_level_3",
-    }
     for cert in dp.authorization_certifications:
-        key = cert_key_map.get(cert, cert.lower().replace(" ", "_"))
+        key = _CERT_KEY_MAP.get(cert, cert.lower().replace(" ", "_"))
         certification_premium += cert_premiums.get(key, 0.0)
 
     # Program of record premium
@@ -174,14 +247,7 @@ def _compute_defense_positioning(deal: DealInput, benchmarks: dict) -> DefensePo
     total_defense_premium = clearance_premium + certification_premium + por_premium
 
     # Build summary
-    clearance_labels = {
-        "unclassified": "Unclassified",
-        "secret": "Secret",
-        "top_secret": "Top Secret",
-        "ts_sci": "Top Secret/SCI",
-        "sap": "SAP",
-    }
-    clearance_label = clearance_labels.get(dp.clearance_level.value, dp.clearance_level.value)
+    clearance_label = _CLEARANCE_LABELS.get(dp.clearance_level.value, dp.clearance_level.value)
 
     parts = []
     parts.append(f"This acquisition gives the buyer access to {clearance_label} facility clearance")
@@ -218,7 +284,224 @@ def _compute_defense_positioning(deal: DealInput, benchmarks: dict) -> DefensePo
 # Main engine
 # ---------------------------------------------------------------------------
 
-def run_deal(deal: DealInput, include_sensitivity: bool = True) -> DealOutput:
+@dataclass(slots=True, frozen=True)
+class _ProjectionDrivers:
+    """Per-deal constants of the pro forma income statement."""
+    acq_ebitda_margin: float
+    tgt_ebitda_margin: float
+    acq_gross_margin: float
+    tgt_gross_margin: float
+    new_shares_issued: float
+    total_shares_pro_forma: float
+
+
+@dataclass(slots=True, frozen=True)
+class _IncomeStatementFigures:
+    """One projected year of the pro forma income statement, before formatting."""
+    revenue: float
+    cogs: float
+    gross_profit: float
+    sga: float
+    ebitda: float
+    da: float
+    ebit: float
+    ebt: float
+    taxes: float
+    net_income: float
+    acquirer_standalone_eps: float
+    pro_forma_eps: float
+    accretion_dilution_pct: float
+
+
+def _projection_drivers(deal: DealInput) -> _ProjectionDrivers:
+    """Margins and pro forma share count shared by every projected year."""
+    acq = deal.acquirer
+    tgt = deal.target
+
+    # EBITDA margin (guarded against zero revenue — Pydantic enforces gt=0, but
+    # be explicit here in case the engine is called directly in tests)
+    acq_ebitda_margin = acq.ebitda / acq.revenue if acq.revenue > 0 else 0.15
+    tgt_ebitda_margin = tgt.ebitda / tgt.revenue if tgt.revenue > 0 else 0.12
+
+    # New shares issued (for stock consideration)
+    new_shares_issued = 0.0
+    if deal.structure.stock_percentage > 0 and acq.share_price > 0:
+        stock_consideration = tgt.acquisition_price * deal.structure.stock_percentage
+        new_shares_issued = stock_consideration / acq.share_price
+
+    return _ProjectionDrivers(
+        acq_ebitda_margin=acq_ebitda_margin,
+        tgt_ebitda_margin=tgt_ebitda_margin,
+        # Gross margin: derive from EBITDA margin + SG&A proxy
+        # Guard against acq_ebitda_margin producing unrealistic gross margins
+        acq_gross_margin=max(0.1, min(0.95, acq_ebitda_margin + 0.20)),
+        tgt_gross_margin=max(0.1, min(0.95, tgt_ebitda_margin + 0.20)),
+        new_shares_issued=new_shares_issued,
+        total_shares_pro_forma=acq.shares_outstanding + new_shares_issued,
+    )
+
+
+def _income_statement_year(
+    deal: DealInput,
+    drivers: _ProjectionDrivers,
+    *,
+    acq_growth: float,
+    tgt_growth: float,
+    acq_rev: float,
+    tgt_rev: float,
+    rev_syn: float,
+    cost_syn: float,
+    incremental_da: float,
+    interest_expense: float,
+    transaction_costs: float,
+    standalone_eps_growth: float,
+) -> _IncomeStatementFigures:
+    """
+    Pro forma income statement arithmetic for a single projected year.
+
+    Shared by run_deal's projection loop and the Year 1 sensitivity fast path,
+    so a grid cell always matches the Year 1 row of a full run.
+
+    Args:
+        deal: Complete deal inputs.
+        drivers: Per-deal margins and share counts from _projection_drivers.
+        acq_growth: Compounded acquirer growth factor for this year.
+        tgt_growth: Compounded target growth factor for this year.
+        acq_rev: Acquirer standalone revenue for this year.
+        tgt_rev: Target standalone revenue for this year.
+        rev_syn: Revenue synergies realized this year.
+        cost_syn: Cost synergies realized this year.
+        incremental_da: Annual PPA step-up D&A.
+        interest_expense: Converged interest expense for this year.
+        transaction_costs: Fees expensed this year (Year 1 only, else 0.0).
+        standalone_eps_growth: Compounded growth of acquirer standalone EPS.
+    """
+    acq = deal.acquirer
+    tgt = deal.target
+
+    total_rev = (acq_rev + tgt_rev) + rev_syn
+
+    # COGS (derive from gross margin; simplified combined approach)
+    combined_cogs = (
+        acq_rev * (1 - drivers.acq_gross_margin)
+        + tgt_rev * (1 - drivers.tgt_gross_margin)
+    )
+    gross_profit = total_rev - combined_cogs
+
+    # SG&A: (gross_margin - ebitda_margin) × revenue for each entity, scaled by growth
+    # No division by acq.revenue needed — use the base margin gap directly.
+    # Cost synergies reduce SG&A.
+    acq_sga = acq_rev * (drivers.acq_gross_margin - drivers.acq_ebitda_margin)
+    tgt_sga = tgt_rev * (drivers.tgt_gross_margin - drivers.tgt_ebitda_margin)
+    combined_sga = acq_sga + tgt_sga - cost_syn
+
+    ebitda = gross_profit - combined_sga
+
+    # D&A: acquirer + target + PPA incremental
+    da_total = (
+        acq.depreciation * acq_growth
+        + tgt.depreciation * tgt_growth
+        + incremental_da
+    )
+    ebit = ebitda - da_total
+
+    # Transaction costs expensed in Year 1 (ASC 805)
+    ebt = ebit - interest_expense
+    if transaction_costs:
+        ebt -= transaction_costs
+
+    taxes = max(0.0, ebt * acq.tax_rate)
+    net_income = ebt - taxes
+
+    shares = drivers.total_shares_pro_forma
+    pro_forma_eps = _safe_float(net_income / shares if shares > 0 else 0.0)
+
+    # Acquirer standalone EPS (grows at _STANDALONE_EPS_GROWTH per year for simplicity)
+    standalone_eps_yr = _safe_float(acq.eps * standalone_eps_growth)
+    accretion_dilution_pct = _safe_float(
+        (pro_forma_eps - standalone_eps_yr) / abs(standalone_eps_yr) * 100
+        if standalone_eps_yr != 0 else 0.0
+    )
+
+    return _IncomeStatementFigures(
+        revenue=total_rev,
+        cogs=combined_cogs,
+        gross_profit=gross_profit,
+        sga=combined_sga,
+        ebitda=ebitda,
+        da=da_total,
+        ebit=ebit,
+        ebt=ebt,
+        taxes=taxes,
+        net_income=net_income,
+        acquirer_standalone_eps=standalone_eps_yr,
+        pro_forma_eps=pro_forma_eps,
+        accretion_dilution_pct=accretion_dilution_pct,
+    )
+
+
+def _year1_accretion(deal: DealInput) -> float:
+    """
+    Year 1 accretion/dilution (decimal) exactly as run_deal reports it.
+
+    The sensitivity grids only need this one number per cell, so this runs the
+    Year 1 slice of run_deal — PPA, the first solver year, the first income
+    statement row — instead of the full pipeline. Year 1 of the debt schedule
+    does not depend on later years, so solving one year gives the same interest.
+    """
+    ppa = compute_ppa(deal)
+    tranches = deal.structure.debt_tranches if deal.structure.debt_tranches else _build_synthetic_tranches(deal)
+    acq = deal.acquirer
+    tgt = deal.target
+    drivers = _projection_drivers(deal)
+
+    acq_growth = 1 + _ACQUIRER_REVENUE_GROWTH
+    tgt_growth = 1 + tgt.revenue_growth_rate
+    acq_rev = acq.revenue * acq_growth
+    tgt_rev = tgt.revenue * tgt_growth
+
+    debt_schedules, _ = build_debt_schedule(
+        tranches=tranches,
+        projection_years=1,
+        ebitda_by_year=[acq_rev * drivers.acq_ebitda_margin + tgt_rev * drivers.tgt_ebitda_margin],
+        da_by_year=[(acq.depreciation + tgt.depreciation) + ppa.total_incremental_annual],
+        capex_by_year=[acq.capex + tgt.capex],
+        tax_rate=acq.tax_rate,
+    )
+
+    year1 = _income_statement_year(
+        deal,
+        drivers,
+        acq_growth=acq_growth,
+        tgt_growth=tgt_growth,
+        acq_rev=acq_rev,
+        tgt_rev=tgt_rev,
+        rev_syn=_synergy_year_value(deal.synergies.revenue_synergies, 1),
+        cost_syn=_synergy_year_value(deal.synergies.cost_synergies, 1),
+        incremental_da=ppa.total_incremental_annual,
+        interest_expense=debt_schedules[0].total_interest_expense,
+        transaction_costs=get_transaction_costs(deal),
+        standalone_eps_growth=1 + _STANDALONE_EPS_GROWTH,
+    )
+    return year1.accretion_dilution_pct / 100
+
+
+def _sensitivity_accretion(deal: DealInput) -> float:
+    """Sensitivity grid cell — Year 1 accretion as decimal, 0.0 if the deal fails.
+    Computes only the Year 1 slice (no full run_deal, so no recursive re-entry).
+    Module-level so it pickles when the grid runs on a process pool.
+    """
+    try:
+        return _year1_accretion(deal)
+    except Exception:
+        return 0.0
+
+
+def run_deal(
+    deal: DealInput,
+    include_sensitivity: bool = True,
+    executor: Executor | None = None,
+) -> DealOutput:
     """
     Execute the full deal model computation.
 
@@ -227,6 +510,9 @@ def run_deal(deal: DealInput, include_sensitivity: bool = True) -> DealOutput:
         include_sensitivity: When False, skips sensitivity matrix generation.
             Always pass False when calling run_deal() from within a sensitivity
             function to prevent exponential recursive re-entry.
+        executor: Optional executor to spread the sensitivity grid cells over.
+            The API leaves this unset — each request already runs on its own
+            worker process, so a nested pool would only oversubscribe the cores.
 
     Returns:
         DealOutput with all computed results.
@@ -250,47 +536,43 @@ def run_deal(deal: DealInput, include_sensitivity: bool = True) -> DealOutput:
     # -----------------------------------------------------------------------
     # Year-by-year projections
     # -----------------------------------------------------------------------
-    acquirer_revenue_growth = 0.03  # Modest organic growth for acquirer
+    acquirer_revenue_growth = _ACQUIRER_REVENUE_GROWTH  # Modest organic growth for acquirer
     target_growth = tgt.revenue_growth_rate
 
-    # EBITDA margin (guarded against zero revenue — Pydantic enforces gt=0, but
-    # be explicit here in case the engine is called directly in tests)
-    acq_ebitda_margin = acq.ebitda / acq.revenue if acq.revenue > 0 else 0.15
-    tgt_ebitda_margin = tgt.ebitda / tgt.revenue if tgt.revenue > 0 else 0.12
-
-    # Gross margin: derive from EBITDA margin + SG&A proxy
-    # Guard against acq_ebitda_margin producing unrealistic gross margins
-    acq_gross_margin_base = max(0.1, min(0.95, acq_ebitda_margin + 0.20))
-    tgt_gross_margin_base = max(0.1, min(0.95, tgt_ebitda_margin + 0.20))
-
-    # Standalone acquirer EPS (for accretion/dilution comparison)
-    acq_standalone_eps = acq.eps
-
-    # New shares issued (for stock consideration)
-    new_shares_issued = 0.0
-    if deal.structure.stock_percentage > 0 and acq.share_price > 0:
-        stock_consideration = deal.target.acquisition_price * deal.structure.stock_percentage
-        new_shares_issued = stock_consideration / acq.share_price
-
-    total_shares_pro_forma = acq.shares_outstanding + new_shares_issued
+    # Margins and pro forma share count, shared with the sensitivity fast path
+    drivers = _projection_drivers(deal)
+    acq_ebitda_margin = drivers.acq_ebitda_margin
+    tgt_ebitda_margin = drivers.tgt_ebitda_margin
+    new_shares_issued = drivers.new_shares_issued
+    total_shares_pro_forma = drivers.total_shares_pro_forma
+
+    # Compounded growth factors per year, shared by the solver inputs, the
+    # income statement (revenue, D&A) and the bridge (target NI)
+    years = range(1, n_years + 1)
+    acq_growth_by_year = [(1 + acquirer_revenue_growth) ** yr for yr in years]
+    tgt_growth_by_year = [(1 + target_growth) ** yr for yr in years]
+    standalone_eps_growth_by_year = [(1 + _STANDALONE_EPS_GROWTH) ** yr for yr in years]
+    acq_rev_by_year = [acq.revenue * g for g in acq_growth_by_year]
+    tgt_rev_by_year = [tgt.revenue * g for g in tgt_growth_by_year]
+
+    # Standalone EBITDA per entity, shared by the solver inputs and the IS detail
+    acq_ebitda_by_year = [acq_rev_yr * acq_ebitda_margin for acq_rev_yr in acq_rev_by_year]
+    tgt_ebitda_by_year = [tgt_rev_yr * tgt_ebitda_margin for tgt_rev_yr in tgt_rev_by_year]
 
     # Build ebitda_by_year for circularity solver (initial estimate before synergies)
-    raw_ebitda_by_year: list[float] = []
-    raw_da_by_year: list[float] = []
-    raw_capex_by_year: list[float] = []
-
-    for yr in range(1, n_years + 1):
-        acq_rev_yr = acq.revenue * (1 + acquirer_revenue_growth) ** yr
-        tgt_rev_yr = tgt.revenue * (1 + target_growth) ** yr
-        combined_rev = acq_rev_yr + tgt_rev_yr
-        combined_ebitda = (
-            acq_rev_yr * acq_ebitda_margin
-            + tgt_rev_yr * tgt_ebitda_margin
-        )
-        raw_ebitda_by_year.append(combined_ebitda)
-        combined_da = (acq.depreciation + tgt.depreciation) + ppa.total_incremental_annual
-        raw_da_by_year.append(combined_da)
-        raw_capex_by_year.append(acq.capex + tgt.capex)
+    raw_ebitda_by_year = [a + t for a, t in zip(acq_ebitda_by_year, tgt_ebitda_by_year)]
+    raw_da_by_year = [(acq.depreciation + tgt.depreciation) + ppa.total_incremental_annual] * n_years
+    capex_yr = acq.capex + tgt.capex
+    raw_capex_by_year = [capex_yr] * n_years
+
+    # Phased-in synergies per year (revenue and cost), from the synergy items
+    # unpacked once into parallel amount / phase-in lists
+    rev_syn_amounts, rev_syn_phases = _synergy_terms(deal.synergies.revenue_synergies)
+    cost_syn_amounts, cost_syn_phases = _synergy_terms(deal.synergies.cost_synergies)
+    # At least 5 years: the scorecard's synergy NPV reads years 1–5 as well
+    syn_years = max(n_years, len(_SYNERGY_DISCOUNT_FACTORS))
+    rev_syn_by_year = _synergy_by_year(rev_syn_amounts, rev_syn_phases, syn_years)
+    cost_syn_by_year = _synergy_by_year(cost_syn_amounts, cost_syn_phases, syn_years)
 
     # Solve circularity across all years
     debt_schedules, any_non_convergence = build_debt_schedule(
@@ -311,6 +593,12 @@ def run_deal(deal: DealInput, include_sensitivity: bool = True) -> DealOutput:
     income_statement: list[IncomeStatementYear] = []
     ad_bridge: list[AccretionDilutionBridge] = []
 
+    # Bridge terms that do not change by year. The per-share terms keep their
+    # divisions (not a multiply by 1/shares) so they round exactly as before.
+    after_tax = 1 - acq.tax_rate
+    has_pro_forma_shares = total_shares_pro_forma > 0
+    da_adj = -(ppa.total_incremental_annual * after_tax) / total_shares_pro_forma if has_pro_forma_shares else 0.0
+
     ebitda_by_year: list[float] = []
     net_income_by_year: list[float] = []
     ending_debt_by_year: list[float] = []
@@ -318,92 +606,62 @@ def run_deal(deal: DealInput, include_sensitivity: bool = True) -> DealOutput:
 
     for yr in range(1, n_years + 1):
         ds = debt_schedules[yr - 1]
-
-        # Revenue projections
-        acq_rev_yr = acq.revenue * (1 + acquirer_revenue_growth) ** yr
-        tgt_rev_yr = tgt.revenue * (1 + target_growth) ** yr
-        combined_rev = acq_rev_yr + tgt_rev_yr
-
-        # Revenue synergies realized this year
-        rev_syn_yr = _synergy_year_value(deal.synergies.revenue_synergies, yr)
-        total_rev = combined_rev + rev_syn_yr
-
-        # COGS (derive from gross margin; simplified combined approach)
-        # acq_gross_margin_base / tgt_gross_margin_base are pre-computed above
-        combined_cogs = (
-            acq_rev_yr * (1 - acq_gross_margin_base)
-            + tgt_rev_yr * (1 - tgt_gross_margin_base)
-        )
-
-        # Cost synergies (reduce SG&A / COGS)
-        cost_syn_yr = _synergy_year_value(deal.synergies.cost_synergies, yr)
-
-        gross_profit = total_rev - combined_cogs
-
-        # SG&A: (gross_margin - ebitda_margin) × revenue for each entity, scaled by growth
-        # No division by acq.revenue needed — use the base margin gap directly
-        acq_sga = acq_rev_yr * (acq_gross_margin_base - acq_ebitda_margin)
-        tgt_sga = tgt_rev_yr * (tgt_gross_margin_base - tgt_ebitda_margin)
-        combined_sga = acq_sga + tgt_sga - cost_syn_yr
-
-        ebitda = gross_profit - combined_sga
-
-        # D&A: acquirer + target + PPA incremental
-        da_total = (
-            acq.depreciation * (1 + acquirer_revenue_growth) ** yr
-            + tgt.depreciation * (1 + target_growth) ** yr
-            + ppa.total_incremental_annual
-        )
-
-        ebit = ebitda - da_total
-
-        # Interest expense from converged debt schedule
+        acq_growth = acq_growth_by_year[yr - 1]
+        tgt_growth = tgt_growth_by_year[yr - 1]
+        acq_rev_yr = acq_rev_by_year[yr - 1]
+        tgt_rev_yr = tgt_rev_by_year[yr - 1]
+        rev_syn_yr = rev_syn_by_year[yr - 1]
+        cost_syn_yr = cost_syn_by_year[yr - 1]
         interest_exp = ds.total_interest_expense
-
-        ebt = ebit - interest_exp
-
-        # Transaction costs expensed in Year 1 (ASC 805)
+        year_costs = transaction_costs if yr == 1 else 0.0
+
+        fig = _income_statement_year(
+            deal,
+            drivers,
+            acq_growth=acq_growth,
+            tgt_growth=tgt_growth,
+            acq_rev=acq_rev_yr,
+            tgt_rev=tgt_rev_yr,
+            rev_syn=rev_syn_yr,
+            cost_syn=cost_syn_yr,
+            incremental_da=ppa.total_incremental_annual,
+            interest_expense=interest_exp,
+            transaction_costs=year_costs,
+            standalone_eps_growth=standalone_eps_growth_by_year[yr - 1],
+        )
         if yr == 1:
-            ebt -= transaction_costs
             notes.append(f"Year 1 includes ${transaction_costs/1e6:.1f}M in transaction fees (one-time, per ASC 805).")
 
-        taxes = max(0.0, ebt * acq.tax_rate)
-        net_income = ebt - taxes
-
-        pro_forma_eps = _safe_float(net_income / total_shares_pro_forma if total_shares_pro_forma > 0 else 0.0)
-
-        # Acquirer standalone EPS (grows at 3% per year for simplicity)
-        standalone_eps_yr = _safe_float(acq_standalone_eps * (1.03 ** yr))
-        accretion_dilution_pct = _safe_float(
-            (pro_forma_eps - standalone_eps_yr) / abs(standalone_eps_yr) * 100
-            if standalone_eps_yr != 0 else 0.0
-        )
+        standalone_eps_yr = fig.acquirer_standalone_eps
+        pro_forma_eps = fig.pro_forma_eps
+        accretion_dilution_pct = fig.accretion_dilution_pct
 
         # FCF for returns roll-forward: NI + D&A - capex - WC change
         # Optional cash sweep (debt paydown from excess FCF) is already reflected
         # in ds.ending_debt_balance, so we track only what remains as free cash.
-        capex_yr = (acq.capex + tgt.capex)
-        fcf_yr = net_income + da_total - capex_yr - ds.optional_cash_sweep
+        fcf_yr = fig.net_income + fig.da - capex_yr - ds.optional_cash_sweep
 
-        ebitda_by_year.append(ebitda)
-        net_income_by_year.append(net_income)
+        ebitda_by_year.append(fig.ebitda)
+        net_income_by_year.append(fig.net_income)
         ending_debt_by_year.append(ds.ending_debt_balance)
         fcf_by_year.append(fcf_yr)
 
-        income_statement.append(IncomeStatementYear(
+        # IS and bridge rows hold only floats computed here from the validated
+        # DealInput, so they skip per-field validation
+        income_statement.append(IncomeStatementYear.model_construct(
             year=yr,
             fiscal_year_label=f"FY{fiscal_year_start + yr - 1}E",
-            revenue=total_rev,
-            cogs=combined_cogs,
-            gross_profit=gross_profit,
-            sga=combined_sga,
-            ebitda=ebitda,
-            da=da_total,
-            ebit=ebit,
+            revenue=fig.revenue,
+            cogs=fig.cogs,
+            gross_profit=fig.gross_profit,
+            sga=fig.sga,
+            ebitda=fig.ebitda,
+            da=fig.da,
+            ebit=fig.ebit,
             interest_expense=interest_exp,
-            ebt=ebt,
-            taxes=taxes,
-            net_income=net_income,
+            ebt=fig.ebt,
+            taxes=fig.taxes,
+            net_income=fig.net_income,
             acquirer_standalone_eps=standalone_eps_yr,
             pro_forma_eps=pro_forma_eps,
             accretion_dilution_pct=accretion_dilution_pct,
@@ -411,12 +669,12 @@ def run_deal(deal: DealInput, include_sensitivity: bool = True) -> DealOutput:
             acquirer_revenue=acq_rev_yr,
             target_revenue=tgt_rev_yr,
             synergy_revenue=rev_syn_yr,
-            acquirer_ebitda=acq_rev_yr * acq_ebitda_margin,
-            target_ebitda=tgt_rev_yr * tgt_ebitda_margin,
+            acquirer_ebitda=acq_ebitda_by_year[yr - 1],
+            target_ebitda=tgt_ebitda_by_year[yr - 1],
             synergy_cost=cost_syn_yr,
             incremental_da=ppa.total_incremental_annual,
             acquisition_interest=interest_exp,
-            transaction_costs=transaction_costs if yr == 1 else 0.0,
+            transaction_costs=year_costs,
         ))
 
         # ------------------------------------------------------------------
@@ -435,17 +693,16 @@ def run_deal(deal: DealInput, include_sensitivity: bool = True) -> DealOutput:
         # The reconciling item makes the bridge tie exactly to the IS EPS delta.
 
         acq_standalone_ni_yr = standalone_eps_yr * acq.shares_outstanding
-        target_ni_yr = tgt.net_income * (1 + target_growth) ** yr
+        target_ni_yr = tgt.net_income * tgt_growth
 
         # Per-share deltas (denominator = pro forma shares for comparability)
-        target_earnings_contribution = target_ni_yr / total_shares_pro_forma if total_shares_pro_forma > 0 else 0.0
-        interest_drag = -(interest_exp * (1 - acq.tax_rate)) / total_shares_pro_forma if total_shares_pro_forma > 0 else 0.0
-        da_adj = -(ppa.total_incremental_annual * (1 - acq.tax_rate)) / total_shares_pro_forma if total_shares_pro_forma > 0 else 0.0
-        syn_benefit = ((cost_syn_yr + rev_syn_yr) * (1 - acq.tax_rate)) / total_shares_pro_forma if total_shares_pro_forma > 0 else 0.0
+        target_earnings_contribution = target_ni_yr / total_shares_pro_forma if has_pro_forma_shares else 0.0
+        interest_drag = -(interest_exp * after_tax) / total_shares_pro_forma if has_pro_forma_shares else 0.0
+        syn_benefit = ((cost_syn_yr + rev_syn_yr) * after_tax) / total_shares_pro_forma if has_pro_forma_shares else 0.0
         share_dilution = (
             # EPS is diluted because the same standalone NI is spread over more shares
             -((acq_standalone_ni_yr / total_shares_pro_forma) - standalone_eps_yr)
-            if new_shares_issued > 0 and total_shares_pro_forma > 0 else 0.0
+            if new_shares_issued > 0 and has_pro_forma_shares else 0.0
         )
 
         # Sum of explicit components
@@ -464,7 +721,7 @@ def run_deal(deal: DealInput, include_sensitivity: bool = True) -> DealOutput:
 
         total_bridge = components_sum + tax_impact  # = actual_eps_delta by construction
 
-        ad_bridge.append(AccretionDilutionBridge(
+        ad_bridge.append(AccretionDilutionBridge.model_construct(
             year=yr,
             target_earnings_contribution=target_earnings_contribution,
             interest_expense_drag=interest_drag,
@@ -514,39 +771,14 @@ def run_deal(deal: DealInput, include_sensitivity: bool = True) -> DealOutput:
     # Sensitivity Matrices
     # -----------------------------------------------------------------------
     if include_sensitivity:
-        def _accretion_fn(modified_deal: DealInput) -> float:
-            """Quick re-run for sensitivity — returns Year 1 accretion as decimal.
-            Calls run_deal with include_sensitivity=False to prevent recursive re-entry.
-            """
-            try:
-                out = run_deal(modified_deal, include_sensitivity=False)
-                if out.pro_forma_income_statement:
-                    return out.pro_forma_income_statement[0].accretion_dilution_pct / 100
-                return 0.0
-            except Exception:
-                return 0.0
-
-        sensitivity_matrices = generate_all_sensitivity_matrices(deal, _accretion_fn)
+        sensitivity_matrices = generate_all_sensitivity_matrices(deal, _sensitivity_accretion, executor)
     else:
         sensitivity_matrices = []
 
     # -----------------------------------------------------------------------
     # Risk Assessment
     # -----------------------------------------------------------------------
-    # Build a stub output for risk analyzer (it only needs IS data)
-    stub_output = DealOutput(
-        pro_forma_income_statement=income_statement,
-        balance_sheet_at_close=balance_sheet,
-        accretion_dilution_bridge=ad_bridge,
-        sensitivity_matrices=[],
-        returns_analysis=returns,
-        risk_assessment=[],
-        deal_verdict=DealVerdict.GREEN,
-        deal_verdict_headline="",
-        deal_verdict_subtext="",
-        deal_scorecard=[],
-    )
-    risks, ai_benchmark_context = analyze_risks(deal, stub_output, benchmarks)
+    risks, ai_benchmark_context = analyze_risks(deal, income_statement, benchmarks)
 
     # -----------------------------------------------------------------------
     # Defense Positioning (only for Defense & National Security deals)
@@ -625,7 +857,7 @@ def run_deal(deal: DealInput, include_sensitivity: bool = True) -> DealOutput:
     total_post_close_debt = acq_debt_total + acq.total_debt
     net_debt_close = total_post_close_debt - acq.cash_on_hand + cash_used  # cash used reduces acquirer cash
     y1_interest = income_statement[0].interest_expense if income_statement else 0.0
-    y1_capex = acq.capex + tgt.capex
+    y1_capex = capex_yr
     # Mandatory amortization from year 1 debt schedule
     y1_mandatory_amort = 0.0
     if debt_schedules:
@@ -667,55 +899,43 @@ def run_deal(deal: DealInput, include_sensitivity: bool = True) -> DealOutput:
     y1 = income_statement[0]
     entry_multiple = _safe_float(returns.entry_multiple)
     post_close_leverage = _safe_float(
-        (acq_debt_total + acq.total_debt) / (acq.ebitda + tgt.ebitda) if (acq.ebitda + tgt.ebitda) > 0 else 0
+        total_post_close_debt / combined_ebitda_close if combined_ebitda_close > 0 else 0
     )
 
-    # IRR at 5yr, base case (entry multiple)
-    base_case_5yr = next(
-        (s for s in returns.scenarios if s.exit_year == 5 and abs(s.exit_multiple - entry_multiple) < 0.6),
-        None
-    )
+    # IRR at 5yr, base case (entry multiple). compute_returns rounds every exit
+    # multiple to 0.1x, so the base case is keyed exactly by the rounded entry multiple.
+    scenarios_by_key = {(s.exit_year, s.exit_multiple): s for s in returns.scenarios}
+    base_case_5yr = scenarios_by_key.get((5, round(entry_multiple, 1)))
     irr_5yr = base_case_5yr.irr * 100 if base_case_5yr else 0.0
 
-    # Total synergy NPV (simple 5yr, 10% discount rate)
-    total_annual_synergies = sum(s.annual_amount for s in deal.synergies.cost_synergies + deal.synergies.revenue_synergies)
+    # Total synergy NPV (simple 5yr, 10% discount rate), from the same
+    # phased per-year series the income statement uses
+    total_annual_synergies = sum(cost_syn_amounts) + sum(rev_syn_amounts)
     synergy_npv = sum(
-        _synergy_year_value(deal.synergies.cost_synergies + deal.synergies.revenue_synergies, yr) / (1.10 ** yr)
-        for yr in range(1, 6)
+        (cost + rev) / discount
+        for cost, rev, discount in zip(cost_syn_by_year, rev_syn_by_year, _SYNERGY_DISCOUNT_FACTORS)
     )
+    # NPV benchmark band: 5% / 15% / 30% of the purchase price
+    syn_npv_low = deal.target.acquisition_price * 0.05
+    syn_npv_mid = deal.target.acquisition_price * 0.15
+    syn_npv_high = deal.target.acquisition_price * 0.30
 
     # Breakeven synergy: minimum synergies for Year 1 accretion
     # At zero synergies, what's the accretion? If negative, how much synergy to break even?
-    y1_no_syn = income_statement[0].accretion_dilution_pct  # Already includes synergies
-    syn_yr1 = _synergy_year_value(deal.synergies.cost_synergies + deal.synergies.revenue_synergies, 1)
     # Approximate: each dollar of synergy (after tax) per share adds to accretion
     breakeven_synergy = max(0.0, total_annual_synergies * 0.3)  # 30% of assumed synergies as minimum threshold
 
-    # Debt paydown timeline
-    paydown_year = n_years
-    for idx, yr_debt in enumerate(ending_debt_by_year):
-        if yr_debt <= acq_debt_total * 0.1:  # 90% paid down
-            paydown_year = idx + 1
-            break
+    # Debt paydown timeline: first year with 90% of acquisition debt repaid
+    paydown_threshold = acq_debt_total * 0.1
+    paydown_year = next(
+        (yr for yr, yr_debt in enumerate(ending_debt_by_year, 1) if yr_debt <= paydown_threshold),
+        n_years,
+    )
 
     ind_key = deal.target.industry.value
     ind_bench = benchmarks.get(ind_key, {})
     ev_range = ind_bench.get("ev_ebitda_multiple_range", {"low": 6, "median": 9, "high": 13})
 
-    def _health(value: float, low: float, mid: float, high: float, higher_is_better: bool = True) -> HealthStatus:
-        if higher_is_better:
-            if value >= mid:
-                return HealthStatus.GOOD
-            if value >= low:
-                return HealthStatus.FAIR
-            return HealthStatus.POOR
-        else:
-            if value <= mid:
-                return HealthStatus.GOOD
-            if value <= high:
-                return HealthStatus.FAIR
-            return HealthStatus.POOR
-
     scorecard: list[ScorecardMetric] = [
         ScorecardMetric(
             name="Entry EV/EBITDA Multiple",
@@ -791,10 +1011,10 @@ def run_deal(deal: DealInput, include_sensitivity: bool = True) -> DealOutput:
             name="Total Synergy Value (NPV)",
             value=synergy_npv,
             formatted_value=_format_currency(synergy_npv),
-            benchmark_low=deal.target.acquisition_price * 0.05,
-            benchmark_median=deal.target.acquisition_price * 0.15,
-            benchmark_high=deal.target.acquisition_price * 0.30,
-            health_status=_health(synergy_npv, deal.target.acquisition_price * 0.05, deal.target.acquisition_price * 0.15, deal.target.acquisition_price * 0.30),
+            benchmark_low=syn_npv_low,
+            benchmark_median=syn_npv_mid,
+            benchmark_high=syn_npv_high,
+            health_status=_health(synergy_npv, syn_npv_low, syn_npv_mid, syn_npv_high),
             description="Net present value of 5-year synergy stream at 10% discount rate",
         ),
     ]
@@ -866,7 +1086,7 @@ def run_deal(deal: DealInput, include_sensitivity: bool = True) -> DealOutput:
             f"The combined company would earn ${y1.pro_forma_eps:.2f} per share vs "
             f"${y1.acquirer_standalone_eps:.2f} standalone — a "
             f"${(y1.pro_forma_eps - y1.acquirer_standalone_eps):.2f} improvement "
-            f"driven primarily by {'cost savings' if sum(s.annual_amount for s in deal.synergies.cost_synergies) > 0 else 'target earnings contribution'}."
+            f"driven primarily by {'cost savings' if sum(cost_syn_amounts) > 0 else 'target earnings contribution'}."
         )
         if is_defense_deal:
             subtext += (
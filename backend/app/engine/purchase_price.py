@@ -25,7 +25,7 @@ from dataclasses import dataclass
 from .models import DealInput, PurchasePriceAllocation as PPAInput
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PPAResult:
     """Results of purchase price allocation."""
     purchase_price: float           # Enterprise value paid
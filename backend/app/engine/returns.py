@@ -28,7 +28,27 @@ def _npv(rate: float, cash_flows: list[float]) -> float:
     Net Present Value of a series of cash flows at a given discount rate.
     cash_flows[0] is t=0 (initial investment, typically negative).
     """
-    return sum(cf / (1 + rate) ** t for t, cf in enumerate(cash_flows))
+    return _npv_and_derivative(rate, cash_flows)[0]
+
+
+def _npv_and_derivative(rate: float, cash_flows: list[float]) -> tuple[float, float]:
+    """
+    NPV and dNPV/drate in one pass.
+
+    The discount factor 1/(1+rate)**t is carried as a running product rather
+    than raised to a power per term, so each Newton step is multiplies only.
+    """
+    v = 1.0 / (1 + rate)
+    discount = 1.0  # v ** t
+    npv = 0.0
+    dnpv = 0.0
+    for t, cf in enumerate(cash_flows):
+        if cf:
+            term = cf * discount
+            npv += term
+            dnpv -= t * term * v
+        discount *= v
+    return npv, dnpv
 
 
 def _irr(cash_flows: list[float]) -> float:
@@ -52,12 +72,7 @@ def _irr(cash_flows: list[float]) -> float:
     rate = 0.15
 
     for _ in range(MAX_IRR_ITERATIONS):
-        npv = _npv(rate, cash_flows)
-        # Derivative of NPV with respect to rate
-        dnpv = sum(
-            -t * cf / (1 + rate) ** (t + 1)
-            for t, cf in enumerate(cash_flows)
-        )
+        npv, dnpv = _npv_and_derivative(rate, cash_flows)
         if dnpv == 0:
             break
         new_rate = rate - npv / dnpv
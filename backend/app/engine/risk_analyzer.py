@@ -7,9 +7,11 @@ tolerance bands — telling the user exactly how much headroom they have.
 """
 from __future__ import annotations
 
+from itertools import chain
+
 from .models import (
     DealInput,
-    DealOutput,
+    IncomeStatementYear,
     Industry,
     RiskItem,
     RiskSeverity,
@@ -18,7 +20,6 @@ from .models import (
 
 def _leverage_risk(
     deal: DealInput,
-    output: DealOutput,
 ) -> RiskItem | None:
     """
     Leverage risk: high debt/EBITDA increases bankruptcy risk and limits flexibility.
@@ -81,7 +82,6 @@ def _leverage_risk(
 
 def _synergy_execution_risk(
     deal: DealInput,
-    output: DealOutput,
 ) -> RiskItem | None:
     """
     Synergy execution risk: are the assumed synergies realistic?
@@ -95,7 +95,7 @@ def _synergy_execution_risk(
 
     total_synergies = sum(
         s.annual_amount
-        for s in deal.synergies.cost_synergies + deal.synergies.revenue_synergies
+        for s in chain(deal.synergies.cost_synergies, deal.synergies.revenue_synergies)
     )
     if total_synergies <= 0:
         return None
@@ -136,7 +136,7 @@ def _synergy_execution_risk(
 
 def _interest_rate_sensitivity_risk(
     deal: DealInput,
-    output: DealOutput,
+    income_statement: list[IncomeStatementYear],
     base_accretion_pct: float,
 ) -> RiskItem | None:
     """
@@ -167,9 +167,9 @@ def _interest_rate_sensitivity_risk(
     # EPS impact per 100bp rate increase
     eps_drag_per_100bp = (acq_debt * 0.01 * (1 - tax_rate)) / shares
 
-    # Current EPS accretion from output (Year 1)
-    if output.pro_forma_income_statement:
-        y1 = output.pro_forma_income_statement[0]
+    # Current EPS accretion from the pro forma income statement (Year 1)
+    if income_statement:
+        y1 = income_statement[0]
         current_eps_accretion = y1.pro_forma_eps - y1.acquirer_standalone_eps
     else:
         return None
@@ -342,7 +342,7 @@ def _integration_cost_risk(deal: DealInput) -> RiskItem | None:
     year1_synergies = 0.0
     total_cost_to_achieve = 0.0
 
-    for s in deal.synergies.cost_synergies + deal.synergies.revenue_synergies:
+    for s in chain(deal.synergies.cost_synergies, deal.synergies.revenue_synergies):
         # Year 1 synergy value based on phase-in
         year1_pct = 1.0 / s.phase_in_years
         year1_synergies += s.annual_amount * year1_pct
@@ -638,7 +638,7 @@ def _defense_cr_shutdown_risk(deal: DealInput) -> RiskItem | None:
 
 def analyze_risks(
     deal: DealInput,
-    output: DealOutput,
+    income_statement: list[IncomeStatementYear],
     benchmarks: dict,
 ) -> tuple[list[RiskItem], str | None]:
     """
@@ -646,7 +646,7 @@ def analyze_risks(
 
     Args:
         deal: Deal inputs.
-        output: Computed deal outputs.
+        income_statement: Computed pro forma income statement.
         benchmarks: Industry benchmark data dict.
 
     Returns:
@@ -654,8 +654,8 @@ def analyze_risks(
         ai_benchmark_context string or None).
     """
     base_accretion = 0.0
-    if output.pro_forma_income_statement:
-        base_accretion = output.pro_forma_income_statement[0].accretion_dilution_pct
+    if income_statement:
+        base_accretion = income_statement[0].accretion_dilution_pct
 
     # Purchase price risk is handled separately because it returns
     # (RiskItem | None, ai_benchmark_context | None) for AI-native targets.
@@ -666,9 +666,9 @@ def analyze_risks(
         price_risk = None
 
     risk_functions = [
-        lambda: _leverage_risk(deal, output),
-        lambda: _synergy_execution_risk(deal, output),
-        lambda: _interest_rate_sensitivity_risk(deal, output, base_accretion),
+        lambda: _leverage_risk(deal),
+        lambda: _synergy_execution_risk(deal),
+        lambda: _interest_rate_sensitivity_risk(deal, income_statement, base_accretion),
         lambda: _integration_cost_risk(deal),
         lambda: _revenue_synergy_concentration_risk(deal),
     ]
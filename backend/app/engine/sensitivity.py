@@ -8,10 +8,12 @@ heatmaps in the frontend.
 """
 from __future__ import annotations
 
-import copy
+from concurrent.futures import Executor
+from functools import partial
+from itertools import chain
 from typing import Callable
 
-from .models import DealInput, SensitivityMatrix
+from .models import AmortizationType, DealInput, DebtTranche, SensitivityMatrix, SynergyItem
 
 
 def _format_cell(value: float) -> str:
@@ -43,6 +45,7 @@ def build_sensitivity_matrix(
     base_col_idx: int = -1,
     row_display_labels: list[str] | None = None,
     col_display_labels: list[str] | None = None,
+    executor: Executor | None = None,
 ) -> SensitivityMatrix:
     """
     Build a 2D sensitivity matrix by calling compute_fn(row_val, col_val)
@@ -59,22 +62,27 @@ def build_sensitivity_matrix(
         base_col_idx: Index of the base case column (-1 = none).
         row_display_labels: Optional display labels with absolute values.
         col_display_labels: Optional display labels with absolute values.
+        executor: Optional executor to evaluate the cells on. compute_fn must
+            be picklable when this is a process pool. None → evaluate serially.
 
     Returns:
         SensitivityMatrix ready for serialization.
     """
+    n_cols = len(col_values)
+    cell_rows = [r for r in row_values for _ in col_values]
+    cell_cols = [c for _ in row_values for c in col_values]
+    if executor is None:
+        results = list(map(compute_fn, cell_rows, cell_cols))
+    else:
+        # One chunk per row keeps the per-task pickling overhead down
+        results = list(executor.map(compute_fn, cell_rows, cell_cols, chunksize=max(1, n_cols)))
+
     data: list[list[float]] = []
     data_labels: list[list[str]] = []
-
-    for row_val in row_values:
-        row_data: list[float] = []
-        row_labels: list[str] = []
-        for col_val in col_values:
-            result = compute_fn(row_val, col_val)
-            row_data.append(round(result, 4))
-            row_labels.append(_format_cell(result * 100))
-        data.append(row_data)
-        data_labels.append(row_labels)
+    for i in range(len(row_values)):
+        row_results = results[i * n_cols:(i + 1) * n_cols]
+        data.append([round(result, 4) for result in row_results])
+        data_labels.append([_format_cell(result * 100) for result in row_results])
 
     return SensitivityMatrix(
         title=title,
@@ -94,6 +102,7 @@ def build_sensitivity_matrix(
 def generate_all_sensitivity_matrices(
     deal: DealInput,
     engine_fn: Callable[[DealInput], float],
+    executor: Executor | None = None,
 ) -> list[SensitivityMatrix]:
     """
     Generate the standard suite of sensitivity matrices for a deal.
@@ -106,6 +115,10 @@ def generate_all_sensitivity_matrices(
     Args:
         deal: The baseline deal inputs.
         engine_fn: Function(deal) → Year 1 accretion/dilution % (decimal).
+            Must be a picklable (module-level) function when executor is a
+            process pool.
+        executor: Optional executor to spread the grid cells over. None →
+            evaluate serially in the caller.
 
     Returns:
         List of SensitivityMatrix objects.
@@ -118,7 +131,7 @@ def generate_all_sensitivity_matrices(
     base_price = deal.target.acquisition_price
     base_synergies = sum(
         s.annual_amount
-        for s in deal.synergies.cost_synergies + deal.synergies.revenue_synergies
+        for s in chain(deal.synergies.cost_synergies, deal.synergies.revenue_synergies)
     )
 
     price_premiums = [-0.20, -0.10, 0.0, 0.10, 0.20, 0.30, 0.40]  # % change vs base
@@ -145,11 +158,7 @@ def generate_all_sensitivity_matrices(
         else:
             syn_col_labels.append(f"{_format_currency_compact(abs_syn)}" if abs_syn > 0 else f"{s:.0%}")
 
-    def price_vs_synergy(price_prem: float, syn_mult: float) -> float:
-        modified = _deep_copy_deal(deal)
-        modified.target.acquisition_price = base_price * (1 + price_prem)
-        _scale_synergies(modified, syn_mult, base_synergies)
-        return engine_fn(modified)
+    price_vs_synergy = partial(_price_vs_synergy_cell, deal, engine_fn, base_price, base_synergies)
 
     matrices.append(build_sensitivity_matrix(
         title="Purchase Price vs Synergies",
@@ -158,6 +167,7 @@ def generate_all_sensitivity_matrices(
         row_values=[p * 100 for p in price_premiums],
         col_values=[s * 100 for s in synergy_multipliers],
         compute_fn=price_vs_synergy,
+        executor=executor,
         base_row_idx=price_base_idx,
         base_col_idx=syn_base_idx,
         row_display_labels=price_row_labels,
@@ -180,23 +190,7 @@ def generate_all_sensitivity_matrices(
             label += " (Base)"
         cash_col_labels.append(label)
 
-    def price_vs_cash_mix(price_prem: float, cash_pct: float) -> float:
-        modified = _deep_copy_deal(deal)
-        modified.target.acquisition_price = base_price * (1 + price_prem)
-        stock_pct = 1.0 - (cash_pct / 100.0) - modified.structure.debt_percentage
-        cash_frac = cash_pct / 100.0
-        # Normalize so cash + stock + debt = 1
-        debt = modified.structure.debt_percentage
-        remaining = 1.0 - debt
-        if remaining <= 0:
-            cash_frac = 0.0
-            stock_frac = 0.0
-        else:
-            cash_frac = min(cash_pct / 100.0, remaining)
-            stock_frac = remaining - cash_frac
-        modified.structure.cash_percentage = cash_frac
-        modified.structure.stock_percentage = stock_frac
-        return engine_fn(modified)
+    price_vs_cash_mix = partial(_price_vs_cash_mix_cell, deal, engine_fn, base_price)
 
     matrices.append(build_sensitivity_matrix(
         title="Purchase Price vs Cash/Stock Mix",
@@ -205,6 +199,7 @@ def generate_all_sensitivity_matrices(
         row_values=[p * 100 for p in price_premiums],
         col_values=[c * 100 for c in [0.0, 0.20, 0.40, 0.60, 0.80, 1.0]],
         compute_fn=price_vs_cash_mix,
+        executor=executor,
         base_row_idx=price_base_idx,
         base_col_idx=cash_base_idx,
         row_display_labels=price_row_labels,
@@ -246,37 +241,7 @@ def generate_all_sensitivity_matrices(
             label += " (Base)"
         lev_col_labels.append(label)
 
-    def interest_vs_leverage(rate_pct: float, turns: float) -> float:
-        modified = _deep_copy_deal(deal)
-        rate = rate_pct / 100.0
-        total_debt_implied = combined_ebitda * turns
-        debt_pct = min(total_debt_implied / base_price, 0.95)
-        remaining = 1.0 - debt_pct
-        # Split remaining between cash and stock proportionally
-        orig_non_debt = (deal.structure.cash_percentage + deal.structure.stock_percentage)
-        if orig_non_debt > 0:
-            cash_frac = (deal.structure.cash_percentage / orig_non_debt) * remaining
-            stock_frac = remaining - cash_frac
-        else:
-            cash_frac = remaining
-            stock_frac = 0.0
-        modified.structure.debt_percentage = debt_pct
-        modified.structure.cash_percentage = cash_frac
-        modified.structure.stock_percentage = stock_frac
-        # Adjust all tranche interest rates
-        for tranche in modified.structure.debt_tranches:
-            tranche.interest_rate = rate
-        # If no tranches, the engine uses blended rate — set via a synthetic tranche
-        if not modified.structure.debt_tranches:
-            from .models import DebtTranche, AmortizationType
-            modified.structure.debt_tranches = [DebtTranche(
-                name="Term Loan",
-                amount=base_price * debt_pct,
-                interest_rate=rate,
-                term_years=7,
-                amortization_type=AmortizationType.STRAIGHT_LINE,
-            )]
-        return engine_fn(modified)
+    interest_vs_leverage = partial(_interest_vs_leverage_cell, deal, engine_fn, base_price, combined_ebitda)
 
     matrices.append(build_sensitivity_matrix(
         title="Interest Rate vs Leverage",
@@ -285,6 +250,7 @@ def generate_all_sensitivity_matrices(
         row_values=[r * 100 for r in interest_rates],
         col_values=leverage_turns,
         compute_fn=interest_vs_leverage,
+        executor=executor,
         base_row_idx=rate_base_idx,
         base_col_idx=lev_base_idx,
         row_display_labels=rate_row_labels,
@@ -294,9 +260,109 @@ def generate_all_sensitivity_matrices(
     return matrices
 
 
-def _deep_copy_deal(deal: DealInput) -> DealInput:
-    """Create a deep copy of a DealInput for sensitivity analysis."""
-    return deal.model_copy(deep=True)
+# ---------------------------------------------------------------------------
+# Grid cells — module-level so they pickle for process-pool executors
+# ---------------------------------------------------------------------------
+
+def _price_vs_synergy_cell(
+    deal: DealInput,
+    engine_fn: Callable[[DealInput], float],
+    base_price: float,
+    base_synergies: float,
+    price_prem: float,
+    syn_mult: float,
+) -> float:
+    modified = _copy_deal(deal)
+    modified.target.acquisition_price = base_price * (1 + price_prem)
+    _scale_synergies(modified, syn_mult, base_synergies)
+    return engine_fn(modified)
+
+
+def _price_vs_cash_mix_cell(
+    deal: DealInput,
+    engine_fn: Callable[[DealInput], float],
+    base_price: float,
+    price_prem: float,
+    cash_pct: float,
+) -> float:
+    modified = _copy_deal(deal)
+    modified.target.acquisition_price = base_price * (1 + price_prem)
+    stock_pct = 1.0 - (cash_pct / 100.0) - modified.structure.debt_percentage
+    cash_frac = cash_pct / 100.0
+    # Normalize so cash + stock + debt = 1
+    debt = modified.structure.debt_percentage
+    remaining = 1.0 - debt
+    if remaining <= 0:
+        cash_frac = 0.0
+        stock_frac = 0.0
+    else:
+        cash_frac = min(cash_pct / 100.0, remaining)
+        stock_frac = remaining - cash_frac
+    modified.structure.cash_percentage = cash_frac
+    modified.structure.stock_percentage = stock_frac
+    return engine_fn(modified)
+
+
+def _interest_vs_leverage_cell(
+    deal: DealInput,
+    engine_fn: Callable[[DealInput], float],
+    base_price: float,
+    combined_ebitda: float,
+    rate_pct: float,
+    turns: float,
+) -> float:
+    modified = _copy_deal(deal)
+    rate = rate_pct / 100.0
+    total_debt_implied = combined_ebitda * turns
+    debt_pct = min(total_debt_implied / base_price, 0.95)
+    remaining = 1.0 - debt_pct
+    # Split remaining between cash and stock proportionally
+    orig_non_debt = (deal.structure.cash_percentage + deal.structure.stock_percentage)
+    if orig_non_debt > 0:
+        cash_frac = (deal.structure.cash_percentage / orig_non_debt) * remaining
+        stock_frac = remaining - cash_frac
+    else:
+        cash_frac = remaining
+        stock_frac = 0.0
+    modified.structure.debt_percentage = debt_pct
+    modified.structure.cash_percentage = cash_frac
+    modified.structure.stock_percentage = stock_frac
+    # Adjust all tranche interest rates
+    for tranche in modified.structure.debt_tranches:
+        tranche.interest_rate = rate
+    # If no tranches, the engine uses blended rate — set via a synthetic tranche
+    if not modified.structure.debt_tranches:
+        modified.structure.debt_tranches = [DebtTranche(
+            name="Term Loan",
+            amount=base_price * debt_pct,
+            interest_rate=rate,
+            term_years=7,
+            amortization_type=AmortizationType.STRAIGHT_LINE,
+        )]
+    return engine_fn(modified)
+
+
+def _copy_deal(deal: DealInput) -> DealInput:
+    """
+    Copy a DealInput for one sensitivity cell.
+
+    The cells only mutate the target, the structure (and its tranches) and the
+    synergy items, so just those are copied; the acquirer, PPA and defense
+    profile are shared read-only. Roughly 3× cheaper than a full deep copy,
+    which had become the dominant per-cell cost.
+    """
+    structure = deal.structure
+    synergies = deal.synergies
+    return deal.model_copy(update={
+        "target": deal.target.model_copy(),
+        "structure": structure.model_copy(update={
+            "debt_tranches": [t.model_copy() for t in structure.debt_tranches],
+        }),
+        "synergies": synergies.model_copy(update={
+            "cost_synergies": [s.model_copy() for s in synergies.cost_synergies],
+            "revenue_synergies": [s.model_copy() for s in synergies.revenue_synergies],
+        }),
+    })
 
 
 def _scale_synergies(deal: DealInput, multiplier: float, base_total: float) -> None:
@@ -304,7 +370,6 @@ def _scale_synergies(deal: DealInput, multiplier: float, base_total: float) -> N
     if base_total <= 0:
         # Add a minimal cost synergy if none exist
         if multiplier > 0:
-            from .models import SynergyItem
             deal.synergies.cost_synergies = [SynergyItem(
                 category="Combined savings",
                 annual_amount=deal.target.revenue * 0.02 * multiplier,
@@ -313,5 +378,5 @@ def _scale_synergies(deal: DealInput, multiplier: float, base_total: float) -> N
             )]
         return
 
-    for s in deal.synergies.cost_synergies + deal.synergies.revenue_synergies:
+    for s in chain(deal.synergies.cost_synergies, deal.synergies.revenue_synergies):
         s.annual_amount = s.annual_amount * multiplier
@@ -12,12 +12,13 @@ explicit low/high ranges tied to market benchmarks (Carta, PitchBook, Equidam Q3
 """
 from __future__ import annotations
 
-import json
 import logging
 import math
 import os
 from typing import Optional
 
+import orjson
+
 from .ai_modifier import AIModifierInput, AIModifierOutput, apply_ai_modifier
 from .startup_models import (
     StartupInput,
@@ -45,12 +46,17 @@ logger = logging.getLogger(__name__)
 _DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "startup_valuation_benchmarks.json")
 
 def _load_benchmarks() -> dict:
-    with open(_DATA_PATH, "r") as f:
-        return json.load(f)
+    with open(_DATA_PATH, "rb") as f:
+        return orjson.loads(f.read())
 
 _BENCHMARKS = _load_benchmarks()
 
 
+def load_benchmarks() -> dict:
+    """Parsed benchmark file, shared with the API routes — treat it as read-only."""
+    return _BENCHMARKS
+
+
 def _get_vertical_data(vertical: StartupVertical, stage: StartupStage) -> dict:
     """Return the benchmark block for a given vertical × stage."""
     vdata = _BENCHMARKS["verticals"].get(vertical.value, {})
@@ -19,12 +19,14 @@ All rates/percentages: decimals (0.20 = 20%).
 """
 from __future__ import annotations
 
-import json
+import functools
 import logging
 import math
 import os
 from typing import Optional
 
+import orjson
+
 from .vc_fund_models import (
     AntiDilutionInput, AntiDilutionOutput, AntiDilutionType,
     BridgeRoundInput, BridgeRoundOutput,
@@ -53,10 +55,19 @@ _DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "vc_benchmark
 # Helpers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
+def load_benchmarks() -> dict:
+    """
+    Parsed vc_benchmarks.json, read once per process and shared with the API
+    routes — treat it as read-only. Raises if the file cannot be loaded.
+    """
+    with open(_DATA_PATH, "rb") as f:
+        return orjson.loads(f.read())
+
+
 def _load_benchmarks() -> dict:
     try:
-        with open(_DATA_PATH, "r") as f:
-            return json.load(f)
+        return load_benchmarks()
     except Exception:
         logger.warning("Could not load vc_benchmarks.json — using hardcoded defaults")
         return {}
@@ -4,6 +4,7 @@ FastAPI application entry point for the dealflow engine.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -11,10 +12,10 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .api.routes import router
+from .api.routes import router, prestart_deal_pool, shutdown_deal_pool
 from .api.ai_routes import router as ai_router
-from .api.startup_routes import router as startup_router
-from .api.vc_routes import router as vc_router
+from .api.startup_routes import router as startup_router, preload_benchmarks as preload_startup_benchmarks
+from .api.vc_routes import router as vc_router, preload_benchmarks as preload_vc_benchmarks
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -29,11 +30,26 @@ async def lifespan(app: FastAPI):
     except ImportError:
         pass
 
-    from .services.ai_service import is_ai_available
+    from .services.ai_service import is_ai_available, close_async_client
     ai_status = "enabled" if is_ai_available() else "disabled (no ANTHROPIC_API_KEY)"
     logger.info("Dealflow Engine API starting up... AI features: %s", ai_status)
+    try:
+        await asyncio.gather(
+            asyncio.to_thread(preload_startup_benchmarks),
+            asyncio.to_thread(preload_vc_benchmarks),
+        )
+    except Exception:
+        # Not fatal: the endpoints retry the load on first use and return 500 until it succeeds
+        logger.exception("Failed to preload benchmark data")
+    try:
+        await asyncio.to_thread(prestart_deal_pool)
+    except Exception:
+        # Not fatal: workers are then spawned on demand by the first requests
+        logger.exception("Failed to prestart deal analysis workers")
     yield
     logger.info("Dealflow Engine API shutting down.")
+    shutdown_deal_pool()
+    await close_async_client()
 
 
 app = FastAPI(
@@ -6,6 +6,7 @@ All Anthropic API interactions go through this module. Features:
 - Graceful fallback when API key is missing or calls fail
 - Streaming support via async generators
 - Simple in-process cache (field explanations, per-deal narratives)
+- Anthropic prompt caching on system prompts and conversation prefixes
 - Token usage tracking
 
 IMPORTANT: The deterministic financial engine is the source of truth for all numbers.
@@ -13,10 +14,12 @@ Claude is used only for interpretation, narrative, and natural language — neve
 """
 from __future__ import annotations
 
-import json
 import logging
 import os
 import hashlib
+import math
+import re
+from collections import OrderedDict
 from typing import Any, AsyncGenerator
 
 logger = logging.getLogger(__name__)
@@ -40,8 +43,13 @@ MAX_TOKENS_SCENARIO = int(os.environ.get("AI_MAX_TOKENS_SCENARIO", "400"))
 # Simple in-process cache (no Redis needed for V1)
 # ---------------------------------------------------------------------------
 
-_cache: dict[str, str] = {}
-_token_usage: dict[str, int] = {"input": 0, "output": 0, "calls": 0}
+_CACHE_MAX_ENTRIES = 1024
+
+# Insertion-ordered dict used as an LRU: hits move to the end, evictions pop the front
+_cache: OrderedDict[str, str] = OrderedDict()
+_token_usage: dict[str, int] = {
+    "input": 0, "output": 0, "calls": 0, "cache_read": 0, "cache_creation": 0,
+}
 
 
 def _cache_key(*parts: str) -> str:
@@ -49,56 +57,130 @@ def _cache_key(*parts: str) -> str:
     return hashlib.md5(combined.encode()).hexdigest()
 
 
+def _bucket(value: float, pct: float = 0.01) -> str:
+    """
+    Quantize a value into geometric bands of width `pct` for use in cache keys,
+    so sub-band tweaks to a deal usually share a cached narrative while deals
+    more than one band apart never do. Sign is preserved; zero is its own band.
+    """
+    if value == 0 or not math.isfinite(value):
+        return str(value)
+    band = round(math.log(abs(value), 1.0 + pct))
+    return f"{'-' if value < 0 else '+'}{band}"
+
+
+_KEY_SEPARATORS_RE = re.compile(r"[\s_\-]+")
+
+
+def _normalize_key_part(text: str) -> str:
+    """
+    Fold away differences in a name that never change Claude's answer — case,
+    spacing, snake/kebab separators — so near-identical requests
+    ("EBITDA margin" / "ebitda_margin") share one cache entry.
+
+    For names only: in a user-entered value "-" and "," carry meaning
+    ("-5%" vs "5%"), and the explanation quotes the value back.
+    """
+    return _KEY_SEPARATORS_RE.sub(" ", text.casefold()).strip()
+
+
 def _get_cached(key: str) -> str | None:
-    return _cache.get(key)
+    value = _cache.get(key)
+    if value is not None:
+        _cache.move_to_end(key)
+    return value
 
 
 def _set_cached(key: str, value: str) -> None:
-    # Simple LRU: evict oldest entries if cache grows large
-    if len(_cache) > 500:
-        oldest_key = next(iter(_cache))
-        del _cache[oldest_key]
     _cache[key] = value
+    _cache.move_to_end(key)
+    if len(_cache) > _CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+# ---------------------------------------------------------------------------
+# Prompt caching (Anthropic cache_control)
+# ---------------------------------------------------------------------------
+
+# System prompts are reused verbatim across requests, and chat resends the whole
+# conversation on every turn. Marking those prefixes ephemeral lets the API serve
+# them from its prompt cache instead of reprocessing every input token.
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _system_blocks(system_prompt: str) -> list[dict[str, Any]]:
+    """Wrap a system prompt as a single cacheable text block."""
+    return [{"type": "text", "text": system_prompt, "cache_control": _CACHE_CONTROL}]
+
+
+def _with_cache_breakpoint(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Mark the last message as a cache breakpoint so the conversation prefix is
+    written to the prompt cache and read back on the next follow-up turn.
+    """
+    if not messages:
+        return messages
+    last = messages[-1]
+    content = last["content"]
+    if isinstance(content, str):
+        content = [{"type": "text", "text": content}]
+    else:
+        content = [dict(block) for block in content]
+    content[-1]["cache_control"] = _CACHE_CONTROL
+    return [*messages[:-1], {"role": last["role"], "content": content}]
+
+
+def _track_usage(response: Any) -> None:
+    """Accumulate token usage (including prompt-cache hits) from an API response."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    _token_usage["input"] += usage.input_tokens
+    _token_usage["output"] += usage.output_tokens
+    _token_usage["cache_read"] += getattr(usage, "cache_read_input_tokens", None) or 0
+    _token_usage["cache_creation"] += getattr(usage, "cache_creation_input_tokens", None) or 0
+    _token_usage["calls"] += 1
 
 
 # ---------------------------------------------------------------------------
 # Client initialization
 # ---------------------------------------------------------------------------
 
-def _get_client():
-    """Get Anthropic client, returning None if not configured."""
-    if not AI_ENABLED:
-        return None
-    if not ANTHROPIC_API_KEY:
-        logger.debug("ANTHROPIC_API_KEY not set — AI features disabled")
-        return None
-    try:
-        import anthropic
-        return anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-    except ImportError:
-        logger.warning("anthropic package not installed — AI features disabled")
-        return None
-    except Exception as e:
-        logger.warning("Failed to initialize Anthropic client: %s", e)
-        return None
+# One AsyncAnthropic per process: its httpx pool keeps connections (and TLS
+# sessions) alive across requests instead of handshaking on every call.
+_async_client = None
 
 
 def _get_async_client():
-    """Get async Anthropic client."""
+    """Get the shared async Anthropic client, returning None if not configured."""
+    global _async_client
     if not AI_ENABLED:
         return None
     if not ANTHROPIC_API_KEY:
+        logger.debug("ANTHROPIC_API_KEY not set — AI features disabled")
         return None
+    if _async_client is not None:
+        return _async_client
     try:
         import anthropic
-        return anthropic.AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
+        _async_client = anthropic.AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
+        return _async_client
     except ImportError:
+        logger.warning("anthropic package not installed — AI features disabled")
         return None
     except Exception as e:
         logger.warning("Failed to initialize async Anthropic client: %s", e)
         return None
 
 
+async def close_async_client() -> None:
+    """Close the shared client's connection pool (called on app shutdown)."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
+
+
 def is_ai_available() -> bool:
     """Check whether AI features are available (key set + package installed)."""
     if not AI_ENABLED or not ANTHROPIC_API_KEY:
@@ -114,14 +196,14 @@ def is_ai_available() -> bool:
 # Core ask functions
 # ---------------------------------------------------------------------------
 
-def ask_claude(
+async def ask_claude_async(
     system_prompt: str,
     user_message: str,
     max_tokens: int = 1000,
     cache_key: str | None = None,
 ) -> str | None:
     """
-    Make a synchronous Claude API call.
+    Make a Claude API call without blocking the event loop.
 
     Args:
         system_prompt: The system prompt that sets Claude's role and context.
@@ -138,24 +220,20 @@ def ask_claude(
         if cached:
             return cached
 
-    client = _get_client()
+    client = _get_async_client()
     if client is None:
         return None
 
     try:
-        response = client.messages.create(
+        response = await client.messages.create(
             model=AI_MODEL,
             max_tokens=max_tokens,
-            system=system_prompt,
+            system=_system_blocks(system_prompt),
             messages=[{"role": "user", "content": user_message}],
         )
         text = response.content[0].text if response.content else ""
 
-        # Track usage
-        if hasattr(response, "usage"):
-            _token_usage["input"] += response.usage.input_tokens
-            _token_usage["output"] += response.usage.output_tokens
-            _token_usage["calls"] += 1
+        _track_usage(response)
 
         if cache_key and text:
             _set_cached(cache_key, text)
@@ -167,7 +245,7 @@ def ask_claude(
         return None
 
 
-def ask_claude_with_history(
+async def ask_claude_with_history_async(
     system_prompt: str,
     messages: list[dict[str, str]],
     max_tokens: int = 2000,
@@ -178,33 +256,78 @@ def ask_claude_with_history(
     Args:
         system_prompt: System prompt.
         messages: List of {"role": "user"|"assistant", "content": "..."} dicts.
+            The final message is marked as a prompt-cache breakpoint so the
+            history prefix is reused on the next turn.
         max_tokens: Max response tokens.
 
     Returns:
         Claude's response text, or None on failure.
     """
-    client = _get_client()
+    client = _get_async_client()
     if client is None:
         return None
 
     try:
-        response = client.messages.create(
+        response = await client.messages.create(
             model=AI_MODEL,
             max_tokens=max_tokens,
-            system=system_prompt,
-            messages=messages,
+            system=_system_blocks(system_prompt),
+            messages=_with_cache_breakpoint(messages),
         )
         text = response.content[0].text if response.content else ""
-        if hasattr(response, "usage"):
-            _token_usage["input"] += response.usage.input_tokens
-            _token_usage["output"] += response.usage.output_tokens
-            _token_usage["calls"] += 1
+        _track_usage(response)
         return text
     except Exception as e:
         logger.warning("Claude API call failed: %s", e)
         return None
 
 
+async def ask_claude_tool_async(
+    system_prompt: str,
+    messages: list[dict[str, str]],
+    tool: dict[str, Any],
+    max_tokens: int = 1000,
+) -> dict[str, Any] | None:
+    """
+    Make a Claude API call that must answer by calling `tool`.
+
+    Used for structured outputs: the tool's input_schema describes the JSON we
+    want, and Claude returns it as an already-decoded tool_use block — no
+    markdown fences, no JSON scaffolding tokens, no parse step.
+
+    Args:
+        system_prompt: System prompt.
+        messages: Conversation, as for ask_claude_with_history_async.
+        tool: Anthropic tool definition ({"name", "description", "input_schema"}).
+        max_tokens: Max response tokens.
+
+    Returns:
+        The tool call's input dict, or None on failure.
+    """
+    client = _get_async_client()
+    if client is None:
+        return None
+
+    try:
+        response = await client.messages.create(
+            model=AI_MODEL,
+            max_tokens=max_tokens,
+            system=_system_blocks(system_prompt),
+            messages=_with_cache_breakpoint(messages),
+            tools=[tool],
+            tool_choice={"type": "tool", "name": tool["name"]},
+        )
+        _track_usage(response)
+        for block in response.content:
+            if block.type == "tool_use":
+                return block.input
+        logger.warning("Claude response had no %s tool call", tool["name"])
+        return None
+    except Exception as e:
+        logger.warning("Claude API call failed: %s", e)
+        return None
+
+
 async def stream_claude(
     system_prompt: str,
     messages: list[dict[str, str]],
@@ -228,18 +351,14 @@ async def stream_claude(
         async with client.messages.stream(
             model=AI_MODEL,
             max_tokens=max_tokens,
-            system=system_prompt,
-            messages=messages,
+            system=_system_blocks(system_prompt),
+            messages=_with_cache_breakpoint(messages),
         ) as stream:
             async for text in stream.text_stream:
                 yield text
 
             # Track final usage
-            final_msg = await stream.get_final_message()
-            if hasattr(final_msg, "usage"):
-                _token_usage["input"] += final_msg.usage.input_tokens
-                _token_usage["output"] += final_msg.usage.output_tokens
-                _token_usage["calls"] += 1
+            _track_usage(await stream.get_final_message())
 
     except Exception as e:
         logger.warning("Claude streaming failed: %s", e)
@@ -325,9 +444,8 @@ OUTPUT FORMAT: Respond with valid JSON:
 }}"""
 
 
-def chat_system_prompt(deal_context: dict[str, Any]) -> str:
-    """System prompt for the AI co-pilot chat."""
-    context_json = json.dumps(deal_context, indent=2, default=str)
+def chat_system_prompt(context_json: str) -> str:
+    """System prompt for the AI co-pilot chat, given the pre-serialized deal context."""
     return f"""You are a senior M&A advisor with deep expertise. You have full context of the deal being modeled.
 
 DEAL CONTEXT:
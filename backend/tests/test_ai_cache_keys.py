@@ -0,0 +1,28 @@
+"""
+Tests for the field-help cache key: names are normalized, values are not.
+"""
+from app.api.ai_routes import FieldHelpRequest, _field_help_cache_key
+
+
+def _key(field_name: str = "ebitda_margin", industry: str = "Software", current_value: str | None = None) -> str:
+    return _field_help_cache_key(FieldHelpRequest(
+        field_name=field_name,
+        field_label="EBITDA Margin",
+        industry=industry,
+        current_value=current_value,
+    ))
+
+
+def test_name_variants_share_a_key():
+    assert _key(field_name="EBITDA margin", industry=" software ") == _key()
+    assert _key(field_name="ebitda-margin") == _key()
+
+
+def test_value_sign_and_separators_are_kept():
+    assert _key(current_value="-5%") != _key(current_value="5%")
+    assert _key(current_value="-0.05") != _key(current_value="0.05")
+    assert _key(current_value="1,5") != _key(current_value="15")
+
+
+def test_value_case_and_padding_are_folded():
+    assert _key(current_value=" 12X ") == _key(current_value="12x")
@@ -0,0 +1,44 @@
+"""
+Tests for the incremental JSON field scanner used to stream narrative sections.
+"""
+import json
+
+from app.api.ai_routes import _TopLevelFieldScanner
+
+
+NARRATIVE = {
+    "verdict_narrative": 'Accretive by 4.2% — "clean" deal, {no} [surprises].\n',
+    "risk_narratives": {"Leverage": "5.1x, above the 4.0x band}", "Synergies": "ok"},
+    "executive_summary": "Para one.\n\nPara two with a \\ backslash.",
+}
+
+
+def _feed_in_chunks(text: str, size: int) -> list[tuple[str, object]]:
+    scanner = _TopLevelFieldScanner()
+    fields = []
+    for i in range(0, len(text), size):
+        fields.extend(scanner.feed(text[i:i + size]))
+    return fields
+
+
+def test_fields_match_full_parse_for_any_chunking():
+    text = json.dumps(NARRATIVE, indent=2)
+    for size in (1, 2, 3, 7, 64, len(text)):
+        assert dict(_feed_in_chunks(text, size)) == NARRATIVE
+
+
+def test_fields_emitted_in_document_order():
+    text = json.dumps(NARRATIVE)
+    assert [k for k, _ in _feed_in_chunks(text, 5)] == list(NARRATIVE)
+
+
+def test_first_field_available_before_stream_ends():
+    text = json.dumps(NARRATIVE)
+    cut = text.index('"risk_narratives"')
+    scanner = _TopLevelFieldScanner()
+    assert list(scanner.feed(text[:cut])) == [("verdict_narrative", NARRATIVE["verdict_narrative"])]
+
+
+def test_markdown_fence_is_ignored():
+    text = "```json\n" + json.dumps(NARRATIVE) + "\n```"
+    assert dict(_feed_in_chunks(text, 4)) == NARRATIVE
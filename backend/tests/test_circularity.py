@@ -3,7 +3,13 @@ Tests for the iterative circularity solver.
 Verifies convergence behavior, debt amortization schedules, and edge cases.
 """
 import pytest
-from app.engine.circularity_solver import solve_year, build_debt_schedule, MAX_ITERATIONS
+from app.engine.circularity_solver import (
+    solve_year,
+    build_debt_schedule,
+    build_debt_schedule_batch,
+    DebtScheduleInputs,
+    MAX_ITERATIONS,
+)
 from app.engine.models import DebtTranche, AmortizationType
 
 
@@ -92,6 +98,27 @@ class TestSingleTrancheStraightLine:
         assert result.iterations <= MAX_ITERATIONS
 
 
+class TestNewtonConvergence:
+    """The Newton update reaches the fixed point in a handful of iterations."""
+
+    def test_active_sweep_converges_quickly(self):
+        # FCF after mandatory principal partially sweeps the tranche, so interest
+        # depends on the sweep — the fully circular case
+        tranche = make_tranche(amount=200_000_000, rate=0.10, term=7, amort=AmortizationType.BULLET)
+        result = solve_year(
+            ebitda=60_000_000, da=5_000_000, capex=4_000_000,
+            working_capital_change=1_000_000, tax_rate=0.25,
+            tranche_balances={tranche.name: tranche.amount}, tranches=[tranche], year=1,
+        )
+        sched = result.tranche_schedules[0]
+        assert result.converged
+        assert result.iterations <= 5
+        assert 0 < sched.optional_paydown < tranche.amount
+        # Fixed point: the interest behind net income matches the average-balance interest
+        interest_in_ni = 55_000_000 - result.net_income / (1 - 0.25)
+        assert abs(interest_in_ni - result.total_interest_expense) <= 1.0
+
+
 class TestBulletTranche:
     """Bullet tranche: no amortization until final year."""
 
@@ -235,3 +262,35 @@ class TestFullDebtSchedule:
             tax_rate=0.25,
         )
         assert not any_non_convergence
+
+    def test_years_after_payoff_skip_the_solver(self):
+        tranche = make_tranche(amount=20_000_000, rate=0.08, term=2)
+        results, _ = build_debt_schedule(
+            tranches=[tranche],
+            projection_years=4,
+            ebitda_by_year=[15_000_000] * 4,
+            da_by_year=[2_000_000] * 4,
+            capex_by_year=[1_500_000] * 4,
+            tax_rate=0.25,
+        )
+        late = results[-1]
+        assert late.iterations == 0 and late.converged
+        assert late.total_interest_expense == 0.0 and late.tranche_schedules == []
+        assert late.net_income == pytest.approx(13_000_000 * 0.75)
+        assert late.free_cash_flow == pytest.approx(13_000_000 * 0.75 + 500_000)
+
+    def test_batch_matches_single_deal_runs(self):
+        deals = [
+            DebtScheduleInputs(
+                tranches=[make_tranche(amount=amount, rate=0.08, term=7)],
+                projection_years=5,
+                ebitda_by_year=[15_000_000] * 5,
+                da_by_year=[2_000_000] * 5,
+                capex_by_year=[1_500_000] * 5,
+                tax_rate=0.25,
+            )
+            for amount in (30_000_000, 60_000_000, 90_000_000)
+        ]
+        expected = [build_debt_schedule(*deal) for deal in deals]
+        assert build_debt_schedule_batch(deals) == expected
+        assert build_debt_schedule_batch(deals, max_workers=2) == expected
@@ -114,6 +114,15 @@ class TestSimpleCashDeal:
         assert any("Accretion" in n or "Dilution" in n for n in names)
         assert any("EPS" in n for n in names)
 
+    def test_scorecard_irr_uses_entry_multiple_scenario(self):
+        returns = self.output.returns_analysis
+        base = next(
+            s for s in returns.scenarios
+            if s.exit_year == 5 and s.exit_multiple == round(returns.entry_multiple, 1)
+        )
+        irr_metric = next(m for m in self.output.deal_scorecard if m.name == "IRR at 5-Year Exit")
+        assert irr_metric.value == pytest.approx(base.irr * 100)
+
     def test_verdict_is_set(self):
         from app.engine.models import DealVerdict
         assert self.output.deal_verdict in list(DealVerdict)
@@ -265,3 +274,17 @@ class TestHighlyLeveragedDeal:
             assert len(matrix.data) == len(matrix.row_values)
             for row in matrix.data:
                 assert len(row) == len(matrix.col_values)
+
+
+class TestRoundFinancialOutput:
+    """The output-boundary rounding pass applied before serialization."""
+
+    def test_float_noise_removed(self):
+        from app.engine import round_financial_output
+        assert round_financial_output({"x": [0.1 + 0.2]}) == {"x": [0.3]}
+
+    def test_input_containers_not_mutated(self):
+        from app.engine import round_financial_output
+        shared = {"band": [0.1 + 0.2]}
+        round_financial_output({"context": shared})
+        assert shared == {"band": [0.1 + 0.2]}
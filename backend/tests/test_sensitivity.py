@@ -10,6 +10,10 @@ import json
 from pathlib import Path
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
+# Every fixture that carries a deal input (the golden file holds expected outputs only)
+DEAL_FIXTURES = sorted(
+    p.name for p in FIXTURES_DIR.glob("*.json") if "input" in json.loads(p.read_text())
+)
 
 
 def load_deal(filename: str) -> DealInput:
@@ -132,3 +136,36 @@ class TestGenerateAllMatrices:
             f"Low price + high synergy ({top_left:.3f}) should beat "
             f"high price + no synergy ({bottom_right:.3f})"
         )
+
+    @pytest.mark.parametrize("fixture", DEAL_FIXTURES)
+    def test_year1_fast_path_matches_full_rerun(self, fixture):
+        """The Year 1 shortcut used for the grids gives the same cells as full re-runs."""
+        from app.engine.financial_engine import _year1_accretion
+
+        def full_rerun(d: DealInput) -> float:
+            return run_deal(d, include_sensitivity=False).pro_forma_income_statement[0].accretion_dilution_pct / 100
+
+        deal = load_deal(fixture)
+        fast: list[float] = []
+        full: list[float] = []
+        generate_all_sensitivity_matrices(deal, lambda d: fast.append(_year1_accretion(d)) or 0.0)
+        generate_all_sensitivity_matrices(deal, lambda d: full.append(full_rerun(d)) or 0.0)
+        assert fast == full
+
+    def test_process_pool_matches_serial(self):
+        """Spreading the grid over a process pool gives the same matrices as the serial sweep."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        deal = load_deal("leveraged_deal.json")
+        serial = run_deal(deal).sensitivity_matrices
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            pooled = run_deal(deal, executor=executor).sensitivity_matrices
+        assert pooled == serial
+
+    @pytest.mark.parametrize("fixture", ["mixed_financing_synergies.json", "all_stock_deal.json"])
+    def test_sweep_leaves_base_deal_untouched(self, fixture):
+        """Cells copy only what they mutate; the base deal must come out unchanged."""
+        deal = load_deal(fixture)
+        before = deal.model_dump()
+        generate_all_sensitivity_matrices(deal, lambda d: 0.0)
+        assert deal.model_dump() == before